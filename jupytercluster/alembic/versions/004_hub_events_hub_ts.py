@@ -0,0 +1,37 @@
+"""Add a composite (hub_id, timestamp) index on hub_events.
+
+Revision ID: 004_hub_events_hub_ts
+Revises: 003_api_tokens
+Create Date: 2026-10-15
+
+The hub detail page and the events API read one hub's events ordered by
+timestamp.  With only the single-column timestamp index that meant filtering
+the global timeline; the composite index turns it into a single range scan.
+
+Index existence is checked before creating so the migration is safe to replay.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "004_hub_events_hub_ts"
+down_revision = "003_api_tokens"
+branch_labels = None
+depends_on = None
+
+_INDEX = "ix_hub_events_hub_ts"
+
+
+def _has_index(table: str, name: str) -> bool:
+    bind = op.get_bind()
+    return name in {ix["name"] for ix in sa.inspect(bind).get_indexes(table)}
+
+
+def upgrade() -> None:
+    if not _has_index("hub_events", _INDEX):
+        op.create_index(_INDEX, "hub_events", ["hub_id", "timestamp"])
+
+
+def downgrade() -> None:
+    if _has_index("hub_events", _INDEX):
+        op.drop_index(_INDEX, table_name="hub_events")
@@ -7,32 +7,89 @@ Follows JupyterHub's API handler conventions:
   cross-origin anyway, and Bearer tokens are not XSRF-vulnerable
 - CORS headers configurable via app.cors_allow_origins
 - Consistent JSON error envelope matching JupyterHub's format
+- JSON bodies are encoded/decoded with orjson when it is installed, falling
+  back to the stdlib ``json`` module otherwise
 """
 
 import json
 import logging
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import Any, Iterable, Optional
 
 from tornado import web
 
+from .. import orm
+from ..dbutil import rollback_if_failed
+from ..utils import check_not_modified
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is used instead
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Built once at import time and shared by every response.  OPT_NON_STR_KEYS
+# accepts non-string dict keys (e.g. ints), as the stdlib json module does.
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+def _json_default(obj: Any) -> Any:
+    """Stdlib fallback for types orjson serialises natively."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialise *obj* to UTF-8 encoded JSON bytes.
+
+    ``datetime`` values are accepted and rendered as ISO-8601 strings, so
+    callers can pass ORM timestamps through without calling ``isoformat()``.
+    Naive datetimes get no UTC offset with either backend, matching
+    ``datetime.isoformat()``.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTS)
+    return json.dumps(obj, default=_json_default).encode("utf-8")
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse UTF-8 encoded JSON *data*.
+
+    orjson accepts bytes directly, so the body is never decoded to an
+    intermediate ``str``.  Both backends raise ``json.JSONDecodeError``
+    (orjson's error type subclasses it) on malformed input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
 
 class APIHandler(web.RequestHandler):
     """Base class for all JupyterCluster API handlers."""
 
+    _app = None
+    _user_resolved = False
+    _resolved_user: Optional[str] = None
+    _is_admin: Optional[bool] = None
+
     # ------------------------------------------------------------------
     # Convenience property — eliminates boilerplate in every handler
     # ------------------------------------------------------------------
 
     @property
     def app(self):
-        """The JupyterCluster application instance."""
-        a = self.application.settings.get("jupytercluster")
-        if a is None:
-            raise web.HTTPError(500, "JupyterCluster application not initialised")
-        return a
+        """The JupyterCluster application instance.
+
+        Looked up once per request; handler instances are not reused.
+        """
+        if self._app is None:
+            a = self.application.settings.get("jupytercluster")
+            if a is None:
+                raise web.HTTPError(500, "JupyterCluster application not initialised")
+            self._app = a
+        return self._app
 
     # ------------------------------------------------------------------
     # Headers — Content-Type + optional CORS
@@ -52,11 +109,8 @@ class APIHandler(web.RequestHandler):
         origin = self.request.headers.get("Origin", "")
         if not origin:
             return
-        allowed = (
-            getattr(self.app, "cors_allow_origins", [])
-            if self.application.settings.get("jupytercluster")
-            else []
-        )
+        app = self.application.settings.get("jupytercluster")
+        allowed = getattr(app, "cors_allow_origins", []) if app is not None else []
         if not allowed:
             return
         if "*" in allowed or origin in allowed:
@@ -76,6 +130,16 @@ class APIHandler(web.RequestHandler):
         self.set_status(204)
         self.finish()
 
+    # ------------------------------------------------------------------
+    # Session hygiene
+    # ------------------------------------------------------------------
+
+    def on_finish(self):
+        """Roll back the shared session if this request left it unusable."""
+        app = self.application.settings.get("jupytercluster")
+        if rollback_if_failed(getattr(app, "db", None)):
+            logger.warning("Rolled back failed database transaction after %s", self.request.uri)
+
     # ------------------------------------------------------------------
     # XSRF — exempt all API handlers (mirrors JupyterHub)
     # ------------------------------------------------------------------
@@ -103,8 +167,6 @@ class APIHandler(web.RequestHandler):
         Returns the ORM object or None.  The lookup uses the SHA-256 digest
         so the raw value is never compared directly (mirrors JupyterHub).
         """
-        from .. import orm
-
         hashed = orm.APIToken.hash(raw)
         try:
             token = self.app.db.query(orm.APIToken).filter_by(hashed_token=hashed).first()
@@ -127,7 +189,17 @@ class APIHandler(web.RequestHandler):
 
         Stores the resolved token ORM object as ``self._api_token`` so that
         ``check_token_scopes()`` can inspect it without a second DB query.
+        The result is cached for the rest of the request, since handlers
+        consult it several times (permission checks, admin checks, scopes).
         """
+        if self._user_resolved:
+            return self._resolved_user
+        self._resolved_user = self._resolve_current_user()
+        self._user_resolved = True
+        return self._resolved_user
+
+    def _resolve_current_user(self) -> Optional[str]:
+        """Do the token/cookie lookup behind :meth:`get_current_user`."""
         self._api_token = None
 
         auth_header = self.request.headers.get("Authorization", "")
@@ -157,7 +229,15 @@ class APIHandler(web.RequestHandler):
     # ------------------------------------------------------------------
 
     def is_admin(self) -> bool:
-        """Return True if the current user has admin privileges."""
+        """Return True if the current user has admin privileges.
+
+        Cached for the rest of the request, like :meth:`get_current_user`.
+        """
+        if self._is_admin is None:
+            self._is_admin = self._check_admin()
+        return self._is_admin
+
+    def _check_admin(self) -> bool:
         user = self.get_current_user()
         if not user:
             return False
@@ -171,9 +251,9 @@ class APIHandler(web.RequestHandler):
         user = self.get_current_user()
         if not user:
             return False
-        if self.is_admin():
+        if user == hub_owner:
             return True
-        return user == hub_owner
+        return self.is_admin()
 
     def require_hub_permission(self, hub_owner: str):
         """Raise HTTP 403 if the current user cannot manage this hub."""
@@ -206,6 +286,16 @@ class APIHandler(web.RequestHandler):
     # Request / response helpers
     # ------------------------------------------------------------------
 
+    def check_not_modified(self, version: Any) -> bool:
+        """Set an ETag derived from *version* and check it against the request.
+
+        The ETag also covers the current user and the request URI, since list
+        responses depend on both.  Returns True (with status 304 set) when the
+        client's ``If-None-Match`` already matches, so the caller can return
+        before doing any query or serialisation work.
+        """
+        return check_not_modified(self, version, self.get_current_user(), self.request.uri)
+
     def get_json_body(self) -> Optional[dict]:
         """Decode and return the JSON request body, or None on failure.
 
@@ -218,12 +308,51 @@ class APIHandler(web.RequestHandler):
             return None
         content_type = self.request.headers.get("Content-Type", "")
         try:
-            return json.loads(body.decode("utf-8"))
+            return json_loads(body)
         except (json.JSONDecodeError, UnicodeDecodeError) as exc:
             if "application/json" in content_type:
                 raise web.HTTPError(400, f"Invalid JSON body: {exc}") from exc
             return None
 
+    def write_json(self, obj: Any):
+        """Serialise *obj* and buffer the resulting bytes as the response body.
+
+        The encoded bytes are handed straight to Tornado, so there is no
+        intermediate ``str`` to re-encode.
+        """
+        self.set_header("Content-Type", "application/json")
+        super().write(json_dumps(obj))
+
+    async def write_json_list(
+        self, key: str, items: Iterable[bytes], extra: dict, chunk_rows: int = 256
+    ):
+        """Stream ``{key: [*items], **extra}`` where *items* are encoded JSON values.
+
+        The array is written piecewise and flushed every *chunk_rows* items,
+        so large listings go out while later rows are still being encoded
+        instead of being assembled into one buffer first.
+        """
+        self.set_header("Content-Type", "application/json")
+        super().write(b'{"' + key.encode("utf-8") + b'":[')
+        for i, item in enumerate(items):
+            if i:
+                if i % chunk_rows == 0:
+                    await self.flush()
+                super().write(b",")
+            super().write(item)
+        super().write(b"]," + json_dumps(extra)[1:] if extra else b"]}")
+
+    def write(self, chunk):
+        """Buffer *chunk*, serialising dicts and lists via :meth:`write_json`.
+
+        Overrides Tornado's default, which always goes through the stdlib
+        ``json`` module (and refuses top-level lists).
+        """
+        if isinstance(chunk, (dict, list)):
+            self.write_json(chunk)
+            return
+        super().write(chunk)
+
     def write_error(self, status_code: int, **kwargs):
         """Emit a consistent JSON error envelope.
 
@@ -231,9 +360,8 @@ class APIHandler(web.RequestHandler):
 
             {"error": {"status_code": 404, "message": "Hub foo not found"}}
         """
-        self.set_header("Content-Type", "application/json")
         if "exc_info" in kwargs:
             message = str(kwargs["exc_info"][1])
         else:
             message = self._reason
-        self.write(json.dumps({"error": {"status_code": status_code, "message": message}}))
+        self.write_json({"error": {"status_code": status_code, "message": message}})
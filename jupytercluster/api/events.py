@@ -89,11 +89,10 @@ class HubEventsAPIHandler(APIHandler):
                     "id": e.id,
                     "event_type": e.event_type,
                     "message": e.message,
-                    "timestamp": e.timestamp.isoformat() if e.timestamp else None,
+                    "timestamp": e.timestamp,
                 }
                 for e in events
             ],
         }
         response.update(pagination_envelope(total, limit, offset))
-        self.set_header("Content-Type", "application/json")
-        self.write(response)
+        self.write_json(response)
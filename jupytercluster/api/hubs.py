@@ -6,9 +6,10 @@ from typing import Optional
 
 from tornado import web
 
+from ..handlers.hubs import _start_hub_bg
 from ..pagination import pagination_envelope, parse_pagination
 from ..utils import parse_config
-from .base import APIHandler
+from .base import APIHandler, json_dumps
 
 logger = logging.getLogger(__name__)
 
@@ -25,25 +26,30 @@ class HubListAPIHandler(APIHandler):
         current_user = self.get_current_user()
         if not current_user:
             raise web.HTTPError(401, "Authentication required")
+        if self.check_not_modified(self.app.hubs_version):
+            return
         is_admin = self.is_admin()
 
         status_filter = self.get_argument("status", None)
         limit, offset = parse_pagination(self)
 
-        # Filter by permission and optional status
+        # Non-admins only ever see their own hubs, so walk the owner index
+        # rather than every hub; serialise just the requested page.
+        if is_admin:
+            candidates = self.app.hubs.values()
+        else:
+            candidates = self.app.iter_hubs_owned_by(current_user)
         visible = [
-            hub.to_dict()
-            for hub in self.app.hubs.values()
-            if (is_admin or hub.owner == current_user)
-            and (status_filter is None or hub.status == status_filter)
+            hub for hub in candidates if status_filter is None or hub.status == status_filter
         ]
 
         total = len(visible)
-        page = visible[offset : offset + limit]
-
-        response = {"hubs": page}
-        response.update(pagination_envelope(total, limit, offset))
-        self.write(response)
+        # Stream the cached per-hub bytes rather than re-serialising every hub
+        await self.write_json_list(
+            "hubs",
+            (hub.to_json(json_dumps) for hub in visible[offset : offset + limit]),
+            pagination_envelope(total, limit, offset),
+        )
 
 
 class HubAPIHandler(APIHandler):
@@ -58,7 +64,7 @@ class HubAPIHandler(APIHandler):
         """GET /api/hubs/:name - Get hub details"""
         hub = self._get_hub_or_404(hub_name)
         self.require_hub_permission(hub.owner)
-        self.write(hub.to_dict())
+        self.write_json(hub.to_dict())
 
     async def post(self, hub_name: str):
         """POST /api/hubs/:name - Create a new hub"""
@@ -91,18 +97,17 @@ class HubAPIHandler(APIHandler):
                 description=description,
                 namespace=namespace,
             )
-            if auto_start:
-                from ..handlers.hubs import _start_hub_bg
-
-                asyncio.create_task(_start_hub_bg(self.app, hub))
-            self.set_status(201)
-            self.write(hub.to_dict())
         except ValueError as e:
             raise web.HTTPError(403, str(e))
         except Exception as e:
             logger.error("Failed to create hub %s: %s", hub_name, e)
             raise web.HTTPError(500, f"Failed to create hub: {e}")
 
+        if auto_start:
+            asyncio.create_task(_start_hub_bg(self.app, hub))
+        self.set_status(201)
+        self.write_json(hub.to_dict())
+
     async def put(self, hub_name: str):
         """PUT /api/hubs/:name - Update a hub"""
         current_user = self.get_current_user()
@@ -132,13 +137,13 @@ class HubAPIHandler(APIHandler):
                 hub.values = spawner._validate_helm_values(values)
             if description is not None:
                 hub.description = description
-            hub._save_to_orm()
             self.app.db.commit()
-            self.write(hub.to_dict())
         except Exception as e:
             logger.error("Failed to update hub %s: %s", hub_name, e)
             raise web.HTTPError(500, f"Failed to update hub: {e}")
 
+        self.write_json(hub.to_dict())
+
     async def delete(self, hub_name: str):
         """DELETE /api/hubs/:name - Delete a hub"""
         hub = self._get_hub_or_404(hub_name)
@@ -156,8 +161,15 @@ class HubAPIHandler(APIHandler):
 class HubActionAPIHandler(APIHandler):
     """Actions on hubs (start, stop)"""
 
+    # action name -> handler method; the route regex only admits these keys
+    _ACTIONS = {"start": "_start", "stop": "_stop"}
+
     async def post(self, hub_name: str, action: str):
         """POST /api/hubs/:name/:action - Perform action on hub"""
+        method_name = self._ACTIONS.get(action)
+        if method_name is None:
+            raise web.HTTPError(400, f"Unknown action: {action!r}")
+
         if hub_name not in self.app.hubs:
             raise web.HTTPError(404, f"Hub {hub_name!r} not found")
 
@@ -165,25 +177,23 @@ class HubActionAPIHandler(APIHandler):
         self.require_hub_permission(hub.owner)
 
         try:
-            if action == "start":
-                if hub.status == "pending":
-                    self.write({"status": "pending", "hub": hub.to_dict()})
-                    return
-                hub.status = "pending"
-                hub._save_to_orm()
-                self.app.db.commit()
-                from ..handlers.hubs import _start_hub_bg
-
-                asyncio.create_task(_start_hub_bg(self.app, hub))
-                self.write({"status": "pending", "hub": hub.to_dict()})
-            elif action == "stop":
-                await hub.stop()
-                self.app.db.commit()
-                self.write({"status": "stopped", "hub": hub.to_dict()})
-            else:
-                raise web.HTTPError(400, f"Unknown action: {action!r}")
-        except web.HTTPError:
-            raise
+            status = await getattr(self, method_name)(hub)
         except Exception as e:
             logger.error("Failed to %s hub %s: %s", action, hub_name, e)
             raise web.HTTPError(500, f"Failed to {action} hub: {e}")
+
+        self.write_json({"status": status, "hub": hub.to_dict()})
+
+    async def _start(self, hub) -> str:
+        """Mark the hub pending and deploy it in the background"""
+        if hub.status != "pending":
+            hub.status = "pending"
+            self.app.db.commit()
+            asyncio.create_task(_start_hub_bg(self.app, hub))
+        return "pending"
+
+    async def _stop(self, hub) -> str:
+        """Stop the hub synchronously"""
+        await hub.stop()
+        self.app.db.commit()
+        return "stopped"
@@ -54,7 +54,7 @@ class InfoAPIHandler(APIHandler):
             ),
         }
 
-        self.write(
+        self.write_json(
             {
                 "version": __version__,
                 "python": platform.python_version(),
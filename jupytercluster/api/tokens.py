@@ -60,7 +60,7 @@ class UserTokenListAPIHandler(APIHandler):
 
         response = {"tokens": [t.to_dict() for t in tokens]}
         response.update(pagination_envelope(total, limit, offset))
-        self.write(response)
+        self.write_json(response)
 
     async def post(self, username: str):
         """Create a new API token for *username*.
@@ -114,7 +114,7 @@ class UserTokenListAPIHandler(APIHandler):
 
         self.set_status(201)
         # Pass raw once — after this response the value is gone forever
-        self.write(token_orm.to_dict(include_token=raw))
+        self.write_json(token_orm.to_dict(include_token=raw))
 
 
 class UserTokenAPIHandler(APIHandler):
@@ -137,7 +137,7 @@ class UserTokenAPIHandler(APIHandler):
         _check_user_permission(self, username)
         user = _get_user_or_404(self.app, username)
         token = self._get_token_or_404(user, token_id)
-        self.write(token.to_dict())
+        self.write_json(token.to_dict())
 
     async def delete(self, username: str, token_id: str):
         """Revoke (permanently delete) a token."""
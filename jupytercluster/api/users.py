@@ -6,13 +6,31 @@ from tornado import web
 
 from .. import orm
 from ..pagination import paginate_query, pagination_envelope, parse_pagination
-from .base import APIHandler
+from .base import APIHandler, json_dumps
 
 logger = logging.getLogger(__name__)
 
 
+# Columns read by _user_dict; listing projects onto these instead of loading
+# full User instances into the session's identity map.
+_USER_COLUMNS = (
+    orm.User.name,
+    orm.User.admin,
+    orm.User.max_hubs,
+    orm.User.allowed_namespaces,
+    orm.User.can_create_namespaces,
+    orm.User.can_delete_namespaces,
+    orm.User.created,
+    orm.User.last_activity,
+)
+
+
 def _user_dict(user: orm.User) -> dict:
-    """Serialise a User ORM object to a JSON-safe dict."""
+    """Serialise a User ORM object (or a ``_USER_COLUMNS`` row) to a dict.
+
+    Timestamps are left as ``datetime`` objects; ``json_dumps`` renders them
+    as ISO-8601 strings natively.
+    """
     return {
         "name": user.name,
         "admin": user.admin,
@@ -20,8 +38,8 @@ def _user_dict(user: orm.User) -> dict:
         "allowed_namespaces": user.allowed_namespaces or [],
         "can_create_namespaces": user.can_create_namespaces,
         "can_delete_namespaces": user.can_delete_namespaces,
-        "created": user.created.isoformat() if user.created else None,
-        "last_activity": user.last_activity.isoformat() if user.last_activity else None,
+        "created": user.created,
+        "last_activity": user.last_activity,
     }
 
 
@@ -42,14 +60,18 @@ class UserListAPIHandler(APIHandler):
         """
         if not self.is_admin():
             raise web.HTTPError(403, "Admin access required")
+        if self.check_not_modified(self.app.users_version):
+            return
 
         limit, offset = parse_pagination(self)
-        q = self.app.db.query(orm.User).order_by(orm.User.name)
+        q = self.app.db.query(*_USER_COLUMNS).order_by(orm.User.name)
         users, total = paginate_query(q, limit, offset)
 
-        response = {"users": [_user_dict(u) for u in users]}
-        response.update(pagination_envelope(total, limit, offset))
-        self.write(response)
+        await self.write_json_list(
+            "users",
+            (json_dumps(_user_dict(u)) for u in users),
+            pagination_envelope(total, limit, offset),
+        )
 
 
 class UserAPIHandler(APIHandler):
@@ -60,7 +82,7 @@ class UserAPIHandler(APIHandler):
         if not self.is_admin():
             raise web.HTTPError(403, "Admin access required")
         user = _get_user_or_404(self.app, username)
-        self.write(_user_dict(user))
+        self.write_json(_user_dict(user))
 
     async def post(self, username: str):
         """POST /api/users/:name — create a new user"""
@@ -82,8 +104,9 @@ class UserAPIHandler(APIHandler):
             )
             self.app.db.add(user)
             self.app.db.commit()
+            self.app.invalidate_user_cache(username)
             self.set_status(201)
-            self.write(_user_dict(user))
+            self.write_json(_user_dict(user))
         except Exception as e:
             logger.error("Failed to create user %s: %s", username, e)
             self.app.db.rollback()
@@ -108,8 +131,8 @@ class UserAPIHandler(APIHandler):
             if "can_delete_namespaces" in body:
                 user.can_delete_namespaces = body["can_delete_namespaces"]
             self.app.db.commit()
-            self.set_header("Content-Type", "application/json")
-            self.write(_user_dict(user))
+            self.app.invalidate_user_cache(username)
+            self.write_json(_user_dict(user))
         except Exception as e:
             logger.error("Failed to update user %s: %s", username, e)
             self.app.db.rollback()
@@ -121,7 +144,7 @@ class UserAPIHandler(APIHandler):
             raise web.HTTPError(403, "Admin access required")
 
         user = _get_user_or_404(self.app, username)
-        user_hubs = [h for h in self.app.hubs.values() if h.owner == username]
+        user_hubs = self.app.hubs_owned_by(username)
         if user_hubs:
             raise web.HTTPError(
                 400, f"Cannot delete {username!r}: user owns {len(user_hubs)} hub(s)"
@@ -129,6 +152,7 @@ class UserAPIHandler(APIHandler):
         try:
             self.app.db.delete(user)
             self.app.db.commit()
+            self.app.invalidate_user_cache(username)
             self.set_status(204)
         except Exception as e:
             logger.error("Failed to delete user %s: %s", username, e)
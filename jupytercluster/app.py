@@ -4,11 +4,15 @@ import asyncio
 import json
 import logging
 import os
+import re
+import secrets
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
-from tornado import web
+from tornado import template, web
 from tornado.ioloop import IOLoop, PeriodicCallback
+from tornado.routing import PathMatches
 from traitlets import Bool
 from traitlets import Dict as TraitDict
 from traitlets import Integer
@@ -23,7 +27,7 @@ from .api.hubs import HubActionAPIHandler, HubAPIHandler, HubListAPIHandler
 from .api.info import InfoAPIHandler
 from .api.tokens import UserTokenAPIHandler, UserTokenListAPIHandler
 from .api.users import UserAPIHandler, UserListAPIHandler
-from .auth import Authenticator, OAuthenticatorWrapper, SimpleAuthenticator
+from .auth import Authenticator, SimpleAuthenticator
 from .handlers.admin import AdminHandler
 from .handlers.error import NotFoundHandler
 from .handlers.home import HomeHandler
@@ -31,6 +35,8 @@ from .handlers.hubs import HubCreateHandler, HubDetailHandler
 from .handlers.login import LoginHandler, LogoutHandler
 from .handlers.profile import ProfileHandler
 from .hub import HubInstance
+from .spawner import HubSpawner, set_helm_concurrency
+from .utils import import_class
 
 try:
     from .handlers.oauth import OAuthCallbackHandler, OAuthLoginHandler
@@ -38,6 +44,12 @@ except ImportError:
     OAuthCallbackHandler = None
     OAuthLoginHandler = None
 
+# Sentinel for optional pre-fetched ORM rows (None means "no such row")
+_NOT_LOADED = object()
+
+# RFC 1123 DNS label, as required by Kubernetes for namespace names
+_NS_RE = re.compile(r"[a-z0-9]([-a-z0-9]{0,61}[a-z0-9])?")
+
 logger = logging.getLogger(__name__)
 
 # Default schema for the hub values GUI editor.
@@ -216,6 +228,16 @@ class JupyterCluster(Application):
         help="Database URL",
     ).tag(config=True)
 
+    db_pool_size = Integer(
+        20,
+        help="Connections kept open in the database connection pool (ignored for SQLite).",
+    ).tag(config=True)
+
+    db_max_overflow = Integer(
+        10,
+        help="Extra connections allowed beyond db_pool_size under load (ignored for SQLite).",
+    ).tag(config=True)
+
     # Authentication
     authenticator_class = Unicode(
         "jupytercluster.auth.SimpleAuthenticator",
@@ -260,6 +282,11 @@ class JupyterCluster(Application):
         ),
     ).tag(config=True)
 
+    helm_concurrency = Integer(
+        8,
+        help="Maximum number of helm processes run at once across all hubs",
+    ).tag(config=True)
+
     allow_namespace_deletion = Bool(
         False,
         help=(
@@ -277,6 +304,25 @@ class JupyterCluster(Application):
         ),
     ).tag(config=True)
 
+    user_cache_ttl = Integer(
+        60,
+        help=(
+            "Seconds to cache User rows looked up during hub creation and permission "
+            "checks. Entries are invalidated when a user is changed via the API. "
+            "Set to 0 to disable caching."
+        ),
+    ).tag(config=True)
+
+    oauth_state_ttl = Integer(
+        600,
+        help="Seconds an OAuth login has to complete before its state token expires",
+    ).tag(config=True)
+
+    oauth_state_limit = Integer(
+        10000,
+        help="Maximum number of pending OAuth logins remembered at once",
+    ).tag(config=True)
+
     # Server configuration
     port = Integer(
         8080,
@@ -293,16 +339,32 @@ class JupyterCluster(Application):
         help="Secret key for secure cookies. If empty, will be generated and stored in database.",
     ).tag(config=True)
 
+    debug = Bool(
+        False,
+        help=(
+            "Run the Tornado application in debug mode (autoreload, uncached templates, "
+            "tracebacks in error pages). Development only."
+        ),
+    ).tag(config=True)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
         # Mirrors JupyterHub: all PeriodicCallback instances stored here so they
         # can be started / stopped as a group and inspected in tests.
         self._periodic_callbacks: Dict[str, PeriodicCallback] = {}
+        # username -> (expiry on the monotonic clock, User row)
+        self._user_cache: Dict[str, Tuple[float, orm.User]] = {}
+        # Bumped on every user create/update/delete; used for list ETags
+        self.users_version = 0
+        # OAuth state token -> (expiry on the monotonic clock, next URL); single use
+        self._oauth_states: Dict[str, Tuple[float, str]] = {}
 
         # Apply env var overrides for bool settings not handled by traitlets env loading
         self._apply_env_overrides()
 
+        set_helm_concurrency(self.helm_concurrency)
+
         # Initialize database
         self._init_database()
 
@@ -311,6 +373,11 @@ class JupyterCluster(Application):
 
         # Load hubs from database
         self.hubs: Dict[str, HubInstance] = {}
+        # Secondary indexes over self.hubs, maintained by _index_hub/_unindex_hub
+        self._ns_index: Set[str] = set()
+        self._owner_index: Dict[str, List[HubInstance]] = {}
+        # Bumped whenever a hub is created, deleted or reloaded; see hubs_version
+        self._hubs_version = 0
         self._load_hubs()
 
         # Initialize web application
@@ -335,6 +402,8 @@ class JupyterCluster(Application):
             self.allow_namespace_deletion = _parse_bool(
                 env["JUPYTERCLUSTER_ALLOW_NAMESPACE_DELETION"]
             )
+        if "JUPYTERCLUSTER_DEBUG" in env:
+            self.debug = _parse_bool(env["JUPYTERCLUSTER_DEBUG"])
         if "JUPYTERCLUSTER_HUB_VALUES_SCHEMA" in env:
             raw = env["JUPYTERCLUSTER_HUB_VALUES_SCHEMA"].strip()
             if raw:
@@ -385,15 +454,74 @@ class JupyterCluster(Application):
         logger.debug("Applied %d fixed schema value(s)", len(fixed))
         return result
 
-    def _can_user_create_namespace(self, username: str) -> bool:
+    def get_user(self, username: str) -> Optional[orm.User]:
+        """Look up a User row, consulting a short-lived per-process cache first.
+
+        Misses are not cached, so newly created users are visible immediately.
+        """
+        now = time.monotonic()
+        entry = self._user_cache.get(username)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        user = self.db.query(orm.User).filter_by(name=username).first()
+        if user is None or self.user_cache_ttl <= 0:
+            self._user_cache.pop(username, None)
+        else:
+            self._user_cache[username] = (now + self.user_cache_ttl, user)
+        return user
+
+    @property
+    def hubs_version(self):
+        """Opaque value that changes whenever the set of hubs or any hub changes"""
+        return (self._hubs_version, HubInstance.revision)
+
+    def invalidate_user_cache(self, username: Optional[str] = None):
+        """Drop *username* (or every user, if None) from the user cache.
+
+        Called after any user change, so this also bumps ``users_version``.
+        """
+        self.users_version += 1
+        if username is None:
+            self._user_cache.clear()
+        else:
+            self._user_cache.pop(username, None)
+
+    def remember_oauth_state(self, next_url: str) -> str:
+        """Issue a single-use OAuth state token that remembers where to go next"""
+        now = time.monotonic()
+        states = self._oauth_states
+        if len(states) >= self.oauth_state_limit:
+            # Drop expired entries, then the oldest ones if still over the limit
+            for key in [k for k, (expires, _) in states.items() if expires <= now]:
+                del states[key]
+            while len(states) >= self.oauth_state_limit:
+                del states[next(iter(states))]
+        state = secrets.token_urlsafe(32)
+        states[state] = (now + self.oauth_state_ttl, next_url)
+        return state
+
+    def pop_oauth_state(self, state: str) -> Optional[str]:
+        """Consume an OAuth state token, returning its next URL (None if unknown/expired)"""
+        entry = self._oauth_states.pop(state, None)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def _can_user_create_namespace(
+        self, username: str, user: Optional[orm.User] = _NOT_LOADED
+    ) -> bool:
         """Check whether a user is permitted to create namespaces (and thus hubs).
 
         Resolution order:
         1. Admins are always allowed.
         2. Per-user ``can_create_namespaces`` if set (not None).
         3. Global ``allow_user_namespace_management``.
+
+        Callers that already fetched the User row (or know it is missing) can
+        pass it as *user* to skip the lookup.
         """
-        user = self.db.query(orm.User).filter_by(name=username).first()
+        if user is _NOT_LOADED:
+            user = self.get_user(username)
         if user and user.admin:
             return True
         if user and user.can_create_namespaces is not None:
@@ -408,7 +536,7 @@ class JupyterCluster(Application):
         2. Per-user ``can_delete_namespaces`` if set (not None).
         3. Global ``allow_user_namespace_management``.
         """
-        user = self.db.query(orm.User).filter_by(name=username).first()
+        user = self.get_user(username)
         if user and user.admin:
             return True
         if user and user.can_delete_namespaces is not None:
@@ -438,7 +566,9 @@ class JupyterCluster(Application):
             logger.warning("Alembic upgrade skipped: %s", e)
 
         # --- Feature 2: Consistent session factory (JupyterHub pattern) ---
-        self.engine, _session_factory = new_session_factory(self.db_url)
+        self.engine, _session_factory = new_session_factory(
+            self.db_url, pool_size=self.db_pool_size, max_overflow=self.db_max_overflow
+        )
         # create_all is idempotent; guards against the alembic-skip case above
         orm.Base.metadata.create_all(self.engine)
         # Single session instance shared across all handlers via app reference —
@@ -490,6 +620,7 @@ class JupyterCluster(Application):
                         user.can_delete_namespaces = user_data["can_delete_namespaces"]
                     logger.info(f"Updated default user: {username}")
             self.db.commit()
+            self.invalidate_user_cache()
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse default users from environment: {e}")
         except Exception as e:
@@ -523,9 +654,7 @@ class JupyterCluster(Application):
 
     def _load_class(self, class_path, base_class):
         """Load a class by path"""
-        module_path, class_name = class_path.rsplit(".", 1)
-        module = __import__(module_path, fromlist=[class_name])
-        cls = getattr(module, class_name)
+        cls = import_class(class_path)
         if not issubclass(cls, base_class):
             raise TypeError(f"{class_path} is not a subclass of {base_class.__name__}")
         return cls
@@ -540,6 +669,64 @@ class JupyterCluster(Application):
             logger.info(f"Loaded {len(self.hubs)} hubs from database")
         except Exception as e:
             logger.error(f"Failed to load hubs: {e}")
+        self._rebuild_hub_indexes()
+
+    def reload_hub(self, name: str) -> Optional[HubInstance]:
+        """Refresh a single hub from the database, returning it (or None if gone)"""
+        try:
+            orm_hub = self.db.query(orm.Hub).filter_by(name=name).first()
+        except Exception as e:
+            logger.error(f"Failed to reload hub {name}: {e}")
+            return self.hubs.get(name)
+
+        self._hubs_version += 1
+        hub = self.hubs.get(name)
+        if hub is not None:
+            self._unindex_hub(hub)
+        if orm_hub is None:
+            self.hubs.pop(name, None)
+            return None
+        if hub is None or hub.orm_hub is not orm_hub:
+            hub = HubInstance(orm_hub)
+            self.hubs[name] = hub
+        else:
+            self.db.refresh(orm_hub)
+            hub._changed()
+        self._index_hub(hub)
+        return hub
+
+    def hubs_owned_by(self, owner: str) -> List[HubInstance]:
+        """Return the hubs owned by *owner* (a copy of the owner index entry)"""
+        return list(self._owner_index.get(owner, ()))
+
+    def iter_hubs_owned_by(self, owner: str) -> Iterator[HubInstance]:
+        """Iterate over the hubs owned by *owner* without copying the owner index"""
+        return iter(self._owner_index.get(owner, ()))
+
+    def hub_count_for(self, owner: str) -> int:
+        """Number of hubs owned by *owner*"""
+        return len(self._owner_index.get(owner, ()))
+
+    def _rebuild_hub_indexes(self):
+        """Rebuild the namespace and owner indexes from self.hubs"""
+        self._ns_index = set()
+        self._owner_index = {}
+        for hub in self.hubs.values():
+            self._index_hub(hub)
+
+    def _index_hub(self, hub: HubInstance):
+        """Add a hub to the namespace and owner indexes"""
+        self._ns_index.add(hub.namespace)
+        self._owner_index.setdefault(hub.owner, []).append(hub)
+
+    def _unindex_hub(self, hub: HubInstance):
+        """Remove a hub from the namespace and owner indexes"""
+        self._ns_index.discard(hub.namespace)
+        owned = self._owner_index.get(hub.owner)
+        if owned is not None:
+            owned[:] = [h for h in owned if h.name != hub.name]
+            if not owned:
+                del self._owner_index[hub.owner]
 
     def _init_web_app(self):
         """Initialize Tornado web application"""
@@ -556,48 +743,10 @@ class JupyterCluster(Application):
         if not os.path.exists(static_path):
             logger.warning(f"Static path not found: {static_path}")
 
-        handlers = [
-            # Web UI
-            (r"/", HomeHandler),
-            (r"/home", HomeHandler),
-            (r"/login", LoginHandler),
-            (r"/logout", LogoutHandler),
-            (r"/profile", ProfileHandler),
-            (r"/admin", AdminHandler),
-            (r"/hubs/create", HubCreateHandler),
-            (r"/hubs/([^/]+)", HubDetailHandler),
-            # OAuth handlers
-            (
-                (r"/oauth_login", OAuthLoginHandler)
-                if OAuthLoginHandler
-                else (r"/oauth_login", web.ErrorHandler, {"status_code": 404})
-            ),
-            (
-                (r"/oauth_callback", OAuthCallbackHandler)
-                if OAuthCallbackHandler
-                else (r"/oauth_callback", web.ErrorHandler, {"status_code": 404})
-            ),
-            # API — info (unauthenticated)
-            (r"/api/info", InfoAPIHandler),
-            # API — hubs (more-specific routes first to avoid capture by the generic one)
-            (r"/api/hubs", HubListAPIHandler),
-            (r"/api/hubs/([^/]+)/events", HubEventsAPIHandler),
-            (r"/api/hubs/([^/]+)/(start|stop)", HubActionAPIHandler),
-            (r"/api/hubs/([^/]+)", HubAPIHandler),
-            # API — users + tokens (token routes before user route to avoid /tokens being a username)
-            (r"/api/users", UserListAPIHandler),
-            (r"/api/users/([^/]+)/tokens", UserTokenListAPIHandler),
-            (r"/api/users/([^/]+)/tokens/([^/]+)", UserTokenAPIHandler),
-            (r"/api/users/([^/]+)", UserAPIHandler),
-            (r"/api/health", HealthHandler),
-            # Error handlers (must be last)
-            (r".*", NotFoundHandler),
-        ]
-
-        # Add OAuth handlers if using OAuthenticator
-        if isinstance(self.authenticator, OAuthenticatorWrapper):
-            oauth_handlers = self.authenticator.get_handlers(self)
-            handlers.extend(oauth_handlers)
+        handlers = _BASE_HANDLERS + _OAUTH_HANDLERS
+        # Authenticator-provided routes go before the catch-all
+        handlers.extend(self.authenticator.get_handlers(self))
+        handlers.append((r".*", NotFoundHandler))
 
         settings = {
             "cookie_secret": self._get_cookie_secret(),
@@ -605,14 +754,28 @@ class JupyterCluster(Application):
             "template_path": template_path,
             "static_path": static_path,
             "static_url_prefix": "/static/",
-            "debug": True,  # Set to False in production
+            "debug": self.debug,
+            # Compile templates and hash static files once unless debugging
+            "compiled_template_cache": not self.debug,
+            "static_hash_cache": not self.debug,
             "xsrf_cookies": True,
             "autoescape": "xhtml_escape",
         }
+        if not self.debug and os.path.isdir(template_path):
+            settings["template_loader"] = self._preload_templates(template_path, settings)
 
         self.web_app = web.Application(handlers, **settings)
         self.web_app.settings["jupytercluster"] = self
 
+    @staticmethod
+    def _preload_templates(template_path: str, settings: Dict) -> template.Loader:
+        """Compile every page template up front so no request pays the parse cost"""
+        loader = template.Loader(template_path, autoescape=settings["autoescape"])
+        for name in sorted(os.listdir(template_path)):
+            if name.endswith(".html"):
+                loader.load(name)
+        return loader
+
     async def create_hub(
         self,
         name: str,
@@ -638,18 +801,17 @@ class JupyterCluster(Application):
             raise ValueError(f"Invalid namespace name: {namespace}")
 
         # Check if namespace already exists (one hub per namespace)
-        if namespace in [h.namespace for h in self.hubs.values()]:
+        if namespace in self._ns_index:
             raise ValueError(f"Namespace {namespace} already in use")
 
         # Check user's hub limit (if configured)
-        user_hubs = [h for h in self.hubs.values() if h.owner == owner]
         # Get user from database to check limits
-        user = self.db.query(orm.User).filter_by(name=owner).first()
-        if user and user.max_hubs and len(user_hubs) >= user.max_hubs:
+        user = self.get_user(owner)
+        if user and user.max_hubs and self.hub_count_for(owner) >= user.max_hubs:
             raise ValueError(f"User {owner} has reached maximum hub limit of {user.max_hubs}")
 
         # Check namespace creation permission
-        if not self._can_user_create_namespace(owner):
+        if not self._can_user_create_namespace(owner, user):
             raise ValueError(
                 f"User {owner} is not allowed to create namespaces/hubs. "
                 "Contact an administrator to enable this permission."
@@ -667,8 +829,6 @@ class JupyterCluster(Application):
 
         # Validate and sanitize values before storing
         # This ensures httpRoute is disabled, extraVolumes/extraVolumeMounts are fixed, etc.
-        from .spawner import HubSpawner
-
         temp_spawner = HubSpawner(
             hub_name=name,
             namespace=namespace,
@@ -714,6 +874,8 @@ class JupyterCluster(Application):
         # Create HubInstance
         hub = HubInstance(orm_hub)
         self.hubs[name] = hub
+        self._index_hub(hub)
+        self._hubs_version += 1
 
         # Write creation event
         hub._log_event("created", f"Hub created by {owner} in namespace {namespace}")
@@ -771,26 +933,28 @@ class JupyterCluster(Application):
         except Exception:
             pass
 
-        # Delete from database
+        # Delete from database: events in one statement, then the hub row
+        self.db.query(orm.HubEvent).filter_by(hub_id=hub.orm_hub.id).delete(
+            synchronize_session=False
+        )
         self.db.delete(hub.orm_hub)
         self.db.commit()
 
         # Remove from cache
         del self.hubs[name]
+        self._unindex_hub(hub)
+        self._hubs_version += 1
 
         logger.info(f"Deleted hub {name}")
 
-    def _is_valid_namespace_name(self, name: str) -> bool:
+    @staticmethod
+    def _is_valid_namespace_name(name: str) -> bool:
         """Validate Kubernetes namespace name"""
         # Kubernetes namespace names must be:
         # - lowercase alphanumeric characters or '-'
         # - start and end with alphanumeric
         # - max 63 characters
-        if len(name) > 63:
-            return False
-        if not name[0].isalnum() or not name[-1].isalnum():
-            return False
-        return all(c.isalnum() or c == "-" for c in name)
+        return bool(_NS_RE.fullmatch(name))
 
     # ------------------------------------------------------------------
     # Feature 1: Startup reconciliation (mirrors JupyterHub init_spawners)
@@ -829,7 +993,6 @@ class JupyterCluster(Application):
                             hub.status,
                         )
                         hub.status = "running"
-                        hub._save_to_orm()
                 else:
                     # poll() returned an exit code → no pods found
                     if hub.status == "pending":
@@ -851,7 +1014,6 @@ class JupyterCluster(Application):
                             result,
                         )
                         hub.status = "stopped"
-                        hub._save_to_orm()
             except Exception:
                 logger.exception("Reconcile: failed to poll hub %s", hub.name)
 
@@ -916,13 +1078,11 @@ class JupyterCluster(Application):
                 if result is None:
                     if hub.status != "running":
                         hub.status = "running"
-                        hub._save_to_orm()
                         changed = True
                 else:
                     if hub.status != "stopped":
                         logger.warning("Hub %s stopped unexpectedly (exit=%s).", hub.name, result)
                         hub.status = "stopped"
-                        hub._save_to_orm()
                         changed = True
             except Exception:
                 logger.exception("Error polling hub %s", hub.name)
@@ -953,6 +1113,7 @@ class JupyterCluster(Application):
         """Initialize or load cookie secret from database"""
         if self.cookie_secret:
             # Use configured secret
+            self._cookie_secret = self.cookie_secret
             return
 
         # Try to load from database
@@ -969,18 +1130,24 @@ class JupyterCluster(Application):
         logger.info("Cookie secret initialized")
 
     def _get_cookie_secret(self) -> str:
-        """Get cookie secret (from config or database)"""
-        if self.cookie_secret:
-            return self.cookie_secret
-        return getattr(self, "_cookie_secret", os.urandom(32).hex())
+        """Get cookie secret (from config or database)
+
+        Set once by ``_init_cookie_secret`` during ``_init_database``; never
+        regenerated here, since a fresh secret would invalidate every session.
+        """
+        return self._cookie_secret
 
 
 class HealthHandler(APIHandler):
     """Health check endpoint for Kubernetes readiness/liveness probes"""
 
+    # Probes hit this many times a second; the body never changes
+    _OK = b'{"status":"ok"}'
+
     def get(self):
         """GET /api/health - Health check"""
-        self.write({"status": "ok"})
+        self.set_header("Content-Type", "application/json")
+        self.write(self._OK)
 
     def head(self):
         """HEAD /api/health - Health check (for probes that use HEAD)"""
@@ -988,6 +1155,53 @@ class HealthHandler(APIHandler):
         self.finish()
 
 
+# API routes, grouped under one /api/ rule so that UI requests skip them with
+# a single match and API requests skip the UI routes. Health probes are by far
+# the most frequent request, so they are matched first.
+_API_HANDLERS = [
+    (r"/api/health", HealthHandler),
+    # API — info (unauthenticated)
+    (r"/api/info", InfoAPIHandler),
+    # API — hubs (more-specific routes first to avoid capture by the generic one)
+    (r"/api/hubs", HubListAPIHandler),
+    (r"/api/hubs/([^/]+)/events", HubEventsAPIHandler),
+    (r"/api/hubs/([^/]+)/(start|stop)", HubActionAPIHandler),
+    (r"/api/hubs/([^/]+)", HubAPIHandler),
+    # API — users + tokens (token routes before user route to avoid /tokens being a username)
+    (r"/api/users", UserListAPIHandler),
+    (r"/api/users/([^/]+)/tokens", UserTokenListAPIHandler),
+    (r"/api/users/([^/]+)/tokens/([^/]+)", UserTokenAPIHandler),
+    (r"/api/users/([^/]+)", UserAPIHandler),
+]
+
+# Routes that do not depend on configuration, built once at import time.
+# _init_web_app appends authenticator routes and the catch-all 404 handler.
+_BASE_HANDLERS = [
+    (PathMatches(r"/api/.*"), _API_HANDLERS),
+    # Web UI
+    (r"/", HomeHandler),
+    (r"/home", HomeHandler),
+    (r"/login", LoginHandler),
+    (r"/logout", LogoutHandler),
+    (r"/profile", ProfileHandler),
+    (r"/admin", AdminHandler),
+    (r"/hubs/create", HubCreateHandler),
+    (r"/hubs/([^/]+)", HubDetailHandler),
+]
+
+
+# Only routed when the optional OAuth handlers imported; otherwise these paths
+# fall through to NotFoundHandler like any other unknown URL.
+_OAUTH_HANDLERS = (
+    [
+        (r"/oauth_login", OAuthLoginHandler),
+        (r"/oauth_callback", OAuthCallbackHandler),
+    ]
+    if OAuthLoginHandler and OAuthCallbackHandler
+    else []
+)
+
+
 def main():
     """Main entry point"""
     app = JupyterCluster()
@@ -8,6 +8,8 @@ from traitlets import Dict as TraitDict
 from traitlets import Unicode, default
 from traitlets.config import LoggingConfigurable
 
+from .utils import import_class
+
 logger = logging.getLogger(__name__)
 
 
@@ -82,9 +84,7 @@ class OAuthenticatorWrapper(Authenticator):
         """Get or create OAuthenticator instance"""
         if self._oa is None:
             # Dynamically import and instantiate OAuthenticator
-            module_path, class_name = self.oauthenticator_class.rsplit(".", 1)
-            module = __import__(module_path, fromlist=[class_name])
-            oa_class = getattr(module, class_name)
+            oa_class = import_class(self.oauthenticator_class)
 
             # Create instance with config
             self._oa = oa_class(parent=self)
@@ -107,18 +107,6 @@ class OAuthenticatorWrapper(Authenticator):
 
         return False
 
-    def get_handlers(self, app) -> List[Tuple[str, type]]:
-        """Get OAuth handlers from OAuthenticator"""
-        # OAuthenticator provides its own handlers
-        # We need to wrap them to work with JupyterCluster
-        handlers = []
-
-        # OAuthenticator typically provides login and oauth_callback handlers
-        # We'll need to create wrapper handlers that integrate with JupyterCluster
-        # For now, return empty - this will be implemented in the handlers
-
-        return handlers
-
 
 class Scope:
     """Authorization scopes for JupyterCluster"""
@@ -4,6 +4,7 @@ Follows JupyterHub's dbutil.py pattern:
 - new_session_factory() creates an engine + sessionmaker with consistent defaults
 - upgrade() wraps alembic to apply pending migrations
 - _temp_alembic_ini() generates an alembic.ini on-the-fly (no checked-in ini needed)
+- rollback_if_failed() recovers the shared session after a failed request
 """
 
 import logging
@@ -13,6 +14,7 @@ from contextlib import contextmanager
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 logger = logging.getLogger(__name__)
 
@@ -117,11 +119,18 @@ def new_session_factory(url: str = "sqlite:///:memory:", **kwargs):
       reconnects stale pooled connections (equivalent to JupyterHub's
       ``register_ping_connection()``).
     * SQLite gets ``check_same_thread=False`` so the async Tornado event loop
-      can use the same connection the sync session was opened on.
+      can use the same connection the sync session was opened on.  SQLite has
+      no server connections worth pooling, so ``pool_size``/``max_overflow``
+      are ignored, and in-memory databases use a single ``StaticPool``
+      connection (each new connection would otherwise be an empty database).
     * MySQL gets ``pool_recycle=60`` to avoid "MySQL server has gone away".
     """
     if url.startswith("sqlite"):
+        kwargs.pop("pool_size", None)
+        kwargs.pop("max_overflow", None)
         kwargs.setdefault("connect_args", {"check_same_thread": False})
+        if url in ("sqlite://", "sqlite:///:memory:"):
+            kwargs.setdefault("poolclass", StaticPool)
     elif url.startswith("mysql"):
         kwargs.setdefault("pool_recycle", 60)
 
@@ -131,3 +140,18 @@ def new_session_factory(url: str = "sqlite:///:memory:", **kwargs):
     # expire_on_commit=False: mirrors JupyterHub — single process, no concurrent writers
     session_factory = sessionmaker(bind=engine, expire_on_commit=False)
     return engine, session_factory
+
+
+def rollback_if_failed(session) -> bool:
+    """Roll back *session* if its transaction has failed; return True if so.
+
+    JupyterCluster shares one session across all handlers (as JupyterHub
+    does), so a failed flush left in place makes every later request raise
+    ``PendingRollbackError``.  Handlers call this from ``on_finish``.  A
+    healthy transaction is left alone so that pending work of other
+    in-flight requests is not discarded.
+    """
+    if session is None or session.is_active:
+        return False
+    session.rollback()
+    return True
@@ -5,7 +5,7 @@ import logging
 from tornado import web
 
 from .. import orm
-from .base import BaseHandler, DictObject
+from .base import BaseHandler, DictObject, HubView
 
 logger = logging.getLogger(__name__)
 
@@ -25,34 +25,31 @@ class AdminHandler(BaseHandler):
 
         app = self.jupytercluster
 
-        # Rollback any pending transaction errors
-        try:
-            app.db.rollback()
-        except Exception:
-            pass
-
-        # Get all users
-        users = app.db.query(orm.User).all()
-        user_list = []
-        for u in users:
-            user_list.append(
-                DictObject(
-                    {
-                        "name": u.name,
-                        "admin": u.admin,
-                        "max_hubs": u.max_hubs,
-                        "allowed_namespaces": u.allowed_namespaces or [],
-                        "created": u.created.isoformat() if u.created else None,
-                        "last_activity": u.last_activity.isoformat() if u.last_activity else None,
-                    }
-                )
+        # Get all users, reading only the columns the page shows
+        rows = app.db.query(
+            orm.User.name,
+            orm.User.admin,
+            orm.User.max_hubs,
+            orm.User.allowed_namespaces,
+            orm.User.created,
+            orm.User.last_activity,
+        ).all()
+        user_list = [
+            DictObject(
+                {
+                    "name": u.name,
+                    "admin": u.admin,
+                    "max_hubs": u.max_hubs,
+                    "allowed_namespaces": u.allowed_namespaces or [],
+                    "created": u.created.isoformat() if u.created else None,
+                    "last_activity": u.last_activity.isoformat() if u.last_activity else None,
+                }
             )
+            for u in rows
+        ]
 
         # Get all hubs
-        all_hubs = []
-        for hub_name, hub in app.hubs.items():
-            hub_dict = hub.to_dict()
-            all_hubs.append(DictObject(hub_dict))
+        all_hubs = [HubView(**hub.to_dict()) for hub in app.hubs.values()]
 
         self.render_template(
             "admin.html",
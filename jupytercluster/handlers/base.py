@@ -1,27 +1,99 @@
 """Base handler for JupyterCluster web interface"""
 
+import json
 import logging
+from functools import cached_property
 from typing import Any, Dict, Optional
 
 from tornado import web
 from tornado.log import access_log
 
+from ..dbutil import rollback_if_failed
+from ..utils import check_not_modified
+
 logger = logging.getLogger(__name__)
 
 
+# Template context defaults, built once at import time. Handler-supplied
+# kwargs always take precedence.
+_COMMON_TEMPLATE_DEFAULTS: Dict[str, Any] = {
+    "base_url": "/",
+    "login_url": "/login",
+    "logout_url": "/logout",
+    "announcement": None,
+}
+
+_TEMPLATE_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "login.html": {
+        "login_service": None,
+        "authenticator_login_url": None,
+        "login_error": None,
+        "username": None,
+    },
+    "hub_create.html": {
+        "error": None,
+        "allowed_namespaces": (),
+        "max_hubs": None,
+        "current_hub_count": 0,
+        "existing_values_yaml": "",
+    },
+    "hub_detail.html": {
+        "error": None,
+        "existing_values_yaml": "",
+    },
+}
+
+
 class DictObject:
     """Dict-like object that supports attribute access for Tornado templates"""
 
     def __init__(self, d: Dict[str, Any]):
-        # Set all dict items as attributes
-        for k, v in d.items():
-            setattr(self, k, v)
-        # Also store as __dict__ for compatibility
+        # Dict items become instance attributes
         self.__dict__.update(d)
 
     def __getitem__(self, key):
         """Support dict-style access"""
-        return getattr(self, key)
+        return self.__dict__[key]
+
+    def get(self, key, default=None):
+        """Support dict-style get"""
+        return self.__dict__.get(key, default)
+
+
+class HubView:
+    """Slotted, read-only-by-convention view of ``HubInstance.to_dict()`` for templates
+
+    Hub lists are the bulk of what the UI renders, so these skip the per-instance
+    ``__dict__`` that ``DictObject`` carries.
+    """
+
+    __slots__ = (
+        "name",
+        "namespace",
+        "owner",
+        "helm_release_name",
+        "helm_chart",
+        "helm_chart_version",
+        "status",
+        "url",
+        "created",
+        "last_activity",
+        "description",
+        "values",
+        "error_message",
+        "values_yaml",
+    )
+
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def __getitem__(self, key):
+        """Support dict-style access"""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
 
     def get(self, key, default=None):
         """Support dict-style get"""
@@ -41,7 +113,9 @@ class BaseHandler(web.RequestHandler):
         """Get JupyterCluster application instance"""
         return self.application.settings.get("jupytercluster")
 
-    @property
+    # current_user and is_admin are read many times per request (handlers,
+    # render_template); cache them so the signed cookie is verified once.
+    @cached_property
     def current_user(self) -> Optional[str]:
         """Get current authenticated user"""
         # Check for user in cookie/session
@@ -50,7 +124,7 @@ class BaseHandler(web.RequestHandler):
             return user.decode("utf-8")
         return None
 
-    @property
+    @cached_property
     def is_admin(self) -> bool:
         """Check if current user is admin"""
         user = self.current_user
@@ -58,6 +132,11 @@ class BaseHandler(web.RequestHandler):
             return False
         return self.jupytercluster.authenticator.is_admin(user)
 
+    def on_finish(self):
+        """Roll back the shared session if this request left it unusable."""
+        if rollback_if_failed(getattr(self.jupytercluster, "db", None)):
+            logger.warning("Rolled back failed database transaction after %s", self.request.uri)
+
     def get_user_or_redirect(self):
         """Get current user or redirect to login"""
         user = self.current_user
@@ -66,57 +145,56 @@ class BaseHandler(web.RequestHandler):
             return None
         return user
 
+    def check_not_modified(self, version: Any) -> bool:
+        """Set an ETag derived from *version* and check it against the request.
+
+        The ETag also covers the viewer, the request URI and the XSRF cookie that
+        rendered forms embed. Returns True (with status 304 set) when the client
+        already has this page, so the caller can skip rendering.
+        """
+        return check_not_modified(
+            self,
+            version,
+            self.current_user,
+            self.is_admin,
+            self.request.uri,
+            self.get_cookie("_xsrf"),
+        )
+
     def render_template(self, name, **kwargs):
         """Render a template with common context"""
-        # Add common template variables
-        kwargs.setdefault("base_url", "/")
-        kwargs.setdefault("user", self.current_user)
-        kwargs.setdefault("is_admin", self.is_admin)
-        kwargs.setdefault("login_url", "/login")
-        kwargs.setdefault("logout_url", "/logout")
-        kwargs.setdefault("announcement", None)
-
-        # Login template specific variables
-        if name == "login.html":
-            kwargs.setdefault("login_service", None)
-            kwargs.setdefault("authenticator_login_url", None)
-            kwargs.setdefault("login_error", None)
-            kwargs.setdefault("username", None)
-
-        # Hub create template specific variables
+        return self.render(name, **self.template_context(name, **kwargs))
+
+    def template_context(self, name, **kwargs) -> Dict[str, Any]:
+        """Build the namespace ``render_template`` passes to template *name*"""
+        app = self.jupytercluster
+        context = {
+            **_COMMON_TEMPLATE_DEFAULTS,
+            **_TEMPLATE_DEFAULTS.get(name, {}),
+            "user": self.current_user,
+            "is_admin": self.is_admin,
+        }
+
         if name == "hub_create.html":
-            kwargs.setdefault("error", None)
-            kwargs.setdefault("allowed_namespaces", [])
-            kwargs.setdefault("max_hubs", None)
-            kwargs.setdefault("current_hub_count", 0)
-            kwargs.setdefault("existing_values_yaml", "")
-            kwargs.setdefault(
-                "default_namespace_prefix",
-                (
-                    self.jupytercluster.default_namespace_prefix
-                    if self.jupytercluster
-                    else "jupyterhub-"
-                ),
+            context["default_namespace_prefix"] = (
+                app.default_namespace_prefix if app else "jupyterhub-"
             )
 
-        # Hub detail template specific variables
-        if name == "hub_detail.html":
-            kwargs.setdefault("error", None)
-            kwargs.setdefault("existing_values_yaml", "")
-
         # Inject hub values schema for templates that include the editor
-        if name in ("hub_create.html", "hub_detail.html"):
-            import json as _json
-
-            schema = self.jupytercluster.get_hub_values_schema() if self.jupytercluster else {}
-            kwargs.setdefault("hub_values_schema_json", _json.dumps(schema))
+        if (
+            name in ("hub_create.html", "hub_detail.html")
+            and "hub_values_schema_json" not in kwargs
+        ):
+            schema = app.get_hub_values_schema() if app else {}
+            context["hub_values_schema_json"] = json.dumps(schema)
 
         # XSRF token for forms
-        try:
-            kwargs.setdefault("xsrf", self.xsrf_token.decode("utf-8") if self.xsrf_token else "")
-        except AttributeError:
-            # xsrf_token might not be available in all contexts
-            kwargs.setdefault("xsrf", "")
-
-        # Render template
-        return self.render(name, **kwargs)
+        if "xsrf" not in kwargs:
+            try:
+                context["xsrf"] = self.xsrf_token.decode("utf-8") if self.xsrf_token else ""
+            except AttributeError:
+                # xsrf_token might not be available in all contexts
+                context["xsrf"] = ""
+
+        context.update(kwargs)
+        return context
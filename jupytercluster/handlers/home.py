@@ -1,8 +1,9 @@
 """Home page handler"""
 
 import logging
+from collections import Counter
 
-from .base import BaseHandler, DictObject
+from .base import BaseHandler, HubView
 
 logger = logging.getLogger(__name__)
 
@@ -16,32 +17,19 @@ class HomeHandler(BaseHandler):
         if not user:
             return
 
-        # Get hubs for this user
+        # Admins see every hub; everyone else only walks their own hubs
         app = self.jupytercluster
-        user_hubs = []
-        all_hubs = []
+        hubs = app.hubs.values() if self.is_admin else app.hubs_owned_by(user)
+        user_hubs = [HubView(**hub.to_dict()) for hub in hubs]
 
-        for hub_name, hub in app.hubs.items():
-            hub_dict = hub.to_dict()
-            hub_obj = DictObject(hub_dict)
-            all_hubs.append(hub_obj)
-
-            # Filter by ownership unless admin
-            if self.is_admin or hub.owner == user:
-                user_hubs.append(hub_obj)
-
-        hub_stats = {
-            "running": sum(1 for h in user_hubs if h.status == "running"),
-            "pending": sum(1 for h in user_hubs if h.status == "pending"),
-            "stopped": sum(1 for h in user_hubs if h.status == "stopped"),
-            "error": sum(1 for h in user_hubs if h.status == "error"),
-        }
+        counts = Counter(h.status for h in user_hubs)
+        hub_stats = {s: counts[s] for s in ("running", "pending", "stopped", "error")}
 
         # Render home page
         self.render_template(
             "home.html",
             hubs=user_hubs,
-            all_hubs=all_hubs if self.is_admin else user_hubs,
+            all_hubs=user_hubs,
             hub_stats=hub_stats,
             user=user,
         )
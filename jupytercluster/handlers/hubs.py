@@ -3,10 +3,12 @@
 import asyncio
 import logging
 
+from sqlalchemy import func
 from tornado import web
 
-from ..utils import format_config, parse_config
-from .base import BaseHandler, DictObject
+from .. import orm
+from ..utils import parse_config
+from .base import BaseHandler, HubView
 
 logger = logging.getLogger(__name__)
 
@@ -36,16 +38,14 @@ class HubCreateHandler(BaseHandler):
         app = self.jupytercluster
 
         # Get user's namespace restrictions to show in UI
-        from .. import orm
-
-        db_user = app.db.query(orm.User).filter_by(name=user).first()
+        db_user = app.get_user(user)
         allowed_namespaces = []
         max_hubs = None
         current_hub_count = 0
         if db_user:
             allowed_namespaces = db_user.allowed_namespaces or []
             max_hubs = db_user.max_hubs
-            current_hub_count = len([h for h in app.hubs.values() if h.owner == user])
+            current_hub_count = app.hub_count_for(user)
 
         self.render_template(
             "hub_create.html",
@@ -136,25 +136,19 @@ class HubDetailHandler(BaseHandler):
         if not self.is_admin and hub.owner != user:
             raise web.HTTPError(403, "Permission denied")
 
+        # The page auto-refreshes while deploying; answer with 304 and skip
+        # rendering until the hub or its event log changes
+        last_event_id = (
+            app.db.query(func.max(orm.HubEvent.id)).filter_by(hub_id=hub.orm_hub.id).scalar()
+        )
+        if self.check_not_modified(f"{hub.name}:{hub.version}:{last_event_id}"):
+            return
+
         # Format values as YAML for display
         hub_dict = hub.to_dict()
-        hub_dict["values_yaml"] = format_config(hub.values, format="yaml")
-
-        # Ensure error_message is included - check both dict, object, and ORM
-        if not hub_dict.get("error_message"):
-            hub_dict["error_message"] = (
-                getattr(hub, "error_message", "")
-                or getattr(hub.orm_hub, "error_message", None)
-                or ""
-            )
-
-        # DEBUG: Ensure status is a string
-        if "status" in hub_dict:
-            hub_dict["status"] = str(hub_dict["status"])
+        hub_dict["values_yaml"] = hub.values_yaml
 
         # Fetch recent events for the event log panel
-        from .. import orm
-
         events = (
             self.jupytercluster.db.query(orm.HubEvent)
             .filter_by(hub_id=hub.orm_hub.id)
@@ -164,7 +158,7 @@ class HubDetailHandler(BaseHandler):
         )
 
         # Convert dict to object for template compatibility (Tornado templates use attribute access)
-        hub_obj = DictObject(hub_dict)
+        hub_obj = HubView(**hub_dict)
         self.render_template(
             "hub_detail.html",
             hub=hub_obj,
@@ -211,12 +205,11 @@ class HubDetailHandler(BaseHandler):
                         _http_route["enabled"] = True
                         sanitized_values["httpRoute"] = _http_route
                     hub.values = sanitized_values
-                    hub._save_to_orm()
                     app.db.commit()
                 except ValueError as e:
                     hub_dict = hub.to_dict()
-                    hub_dict["values_yaml"] = format_config(hub.values, format="yaml")
-                    hub_obj = DictObject(hub_dict)
+                    hub_dict["values_yaml"] = hub.values_yaml
+                    hub_obj = HubView(**hub_dict)
                     self.render_template(
                         "hub_detail.html",
                         hub=hub_obj,
@@ -229,7 +222,6 @@ class HubDetailHandler(BaseHandler):
             # Handle description update
             if description is not None:
                 hub.description = description
-                hub._save_to_orm()
                 app.db.commit()
 
             # Handle actions
@@ -240,7 +232,6 @@ class HubDetailHandler(BaseHandler):
                     return
                 # Mark as pending immediately so the detail page shows the spinner
                 hub.status = "pending"
-                hub._save_to_orm()
                 app.db.commit()
                 # Deploy in background; browser auto-refreshes every 5 s
                 asyncio.create_task(_start_hub_bg(app, hub))
@@ -267,19 +258,11 @@ class HubDetailHandler(BaseHandler):
                 pass
 
             # Reload hub to get updated error_message
-            app._load_hubs()
-            hub = app.hubs.get(hub_name)
+            hub = app.reload_hub(hub_name)
             if hub:
                 hub_dict = hub.to_dict()
-                hub_dict["values_yaml"] = format_config(hub.values, format="yaml")
-                # Ensure error_message is included - check both dict and object
-                if not hub_dict.get("error_message"):
-                    hub_dict["error_message"] = (
-                        getattr(hub, "error_message", "")
-                        or getattr(hub.orm_hub, "error_message", None)
-                        or ""
-                    )
-                hub_obj = DictObject(hub_dict)
+                hub_dict["values_yaml"] = hub.values_yaml
+                hub_obj = HubView(**hub_dict)
                 self.render_template(
                     "hub_detail.html",
                     hub=hub_obj,
@@ -1,6 +1,7 @@
 """Login handlers for JupyterCluster"""
 
 import logging
+from typing import Optional, Tuple
 from urllib.parse import urlparse, urlunparse
 
 from tornado import web
@@ -11,6 +12,12 @@ from .base import BaseHandler
 
 logger = logging.getLogger(__name__)
 
+# Stands in for the per-request XSRF token when pre-rendering the login form
+_XSRF_PLACEHOLDER = "__jupytercluster_xsrf_token__"
+# Application settings key holding the (before-token, after-token) halves of
+# the pre-rendered login form, so each Application keeps its own copy
+_LOGIN_PAGE_SETTING = "jupytercluster_login_page"
+
 
 class LoginHandler(BaseHandler):
     """Handle login page and OAuth flow"""
@@ -29,13 +36,41 @@ class LoginHandler(BaseHandler):
             self.redirect("/oauth_login")
             return
 
-        # Render login form for non-OAuth authenticators
-        # Pass login_service and authenticator_login_url as None for simple auth
-        self.render_template(
+        # Render login form for non-OAuth authenticators.
+        # The form only varies by its XSRF token, so outside debug mode it is
+        # rendered once and the token is spliced in on each request.
+        page = None
+        if not self.settings.get("debug"):
+            page = self.settings.get(_LOGIN_PAGE_SETTING)
+            if page is None:
+                # An empty tuple records that the form could not be split
+                page = self.settings[_LOGIN_PAGE_SETTING] = self._prerender_login_page() or ()
+        if not page:
+            # Pass login_service and authenticator_login_url as None for simple auth
+            self.render_template(
+                "login.html",
+                login_service=None,
+                authenticator_login_url=None,
+            )
+            return
+        head, tail = page
+        self.finish(head + self.xsrf_token + tail)
+
+    def _prerender_login_page(self) -> Optional[Tuple[bytes, bytes]]:
+        """Render the anonymous login form, split around the XSRF token"""
+        html = self.render_string(
             "login.html",
-            login_service=None,
-            authenticator_login_url=None,
+            **self.template_context(
+                "login.html",
+                login_service=None,
+                authenticator_login_url=None,
+                xsrf=_XSRF_PLACEHOLDER,
+            ),
         )
+        head, sep, tail = html.partition(_XSRF_PLACEHOLDER.encode())
+        if not sep or _XSRF_PLACEHOLDER.encode() in tail:
+            return None
+        return head, tail
 
     async def post(self):
         """Handle form-based login"""
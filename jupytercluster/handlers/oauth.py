@@ -1,17 +1,43 @@
 """OAuth callback handlers for OAuthenticator integration"""
 
+import hmac
 import logging
-import secrets
+from functools import lru_cache
+from typing import Optional, Tuple
 from urllib.parse import urlencode, urlparse
 
 from tornado import web
-from tornado.httputil import url_concat
 
 from .base import BaseHandler
 
 logger = logging.getLogger(__name__)
 
 
+class _OAuthHandlerShim:
+    """Minimal stand-in for the handler ``OAuthenticator.authenticate`` expects"""
+
+    def __init__(self, request):
+        self.request = request
+        self.settings = {}
+
+
+@lru_cache(maxsize=None)
+def _oauth_dispatch(oa_class: type) -> Tuple[Optional[str], Optional[str]]:
+    """Resolve, once per OAuthenticator class, which token/user methods it provides
+
+    Returns:
+        (token_for_code method name, user_for_token method name), None where missing
+    """
+
+    def first(*names):
+        return next((name for name in names if hasattr(oa_class, name)), None)
+
+    return (
+        first("token_for_code", "_token_for_code"),
+        first("user_for_token", "_user_for_token"),
+    )
+
+
 class OAuthLoginHandler(BaseHandler):
     """Handle OAuth login initiation"""
 
@@ -25,13 +51,17 @@ class OAuthLoginHandler(BaseHandler):
 
         oa = authenticator.oauthenticator
 
-        # Generate state for CSRF protection
-        state = secrets.token_urlsafe(32)
-        self.set_secure_cookie("oauth_state", state, expires_days=1)
-
-        # Store next URL if provided
-        next_url = self.get_argument("next", "/")
-        self.set_secure_cookie("oauth_next", next_url, expires_days=1)
+        # Generate state for CSRF protection. The token is single-use and kept
+        # server-side with the next URL, so the cookie only needs the raw value.
+        app = self.jupytercluster
+        state = app.remember_oauth_state(self.get_argument("next", "/"))
+        self.set_cookie(
+            "oauth_state",
+            state,
+            expires_days=app.oauth_state_ttl / 86400,
+            httponly=True,
+            secure=self.request.protocol == "https",
+        )
 
         # Get OAuth authorization URL
         # OAuthenticator typically provides this via get_handlers
@@ -47,13 +77,11 @@ class OAuthLoginHandler(BaseHandler):
 
         # Add state and redirect_uri to auth URL
         redirect_uri = f"{self.request.protocol}://{self.request.host}/oauth_callback"
-        auth_url = url_concat(
-            auth_url,
-            {
-                "state": state,
-                "redirect_uri": redirect_uri,
-            },
-        )
+        # Only two known params, so append them directly rather than
+        # round-tripping the URL through url_concat's parse/unparse
+        query = urlencode({"state": state, "redirect_uri": redirect_uri})
+        separator = "&" if "?" in auth_url else "?"
+        auth_url = f"{auth_url}{separator}{query}"
 
         self.redirect(auth_url)
 
@@ -71,19 +99,22 @@ class OAuthCallbackHandler(BaseHandler):
 
         oa = authenticator.oauthenticator
 
-        # Verify state (CSRF protection)
+        # Verify state (CSRF protection): it must match this browser's cookie
+        # and be a live token issued by OAuthLoginHandler
         state = self.get_argument("state", None)
-        cookie_state = self.get_secure_cookie("oauth_state")
+        cookie_state = self.get_cookie("oauth_state")
         if not state or not cookie_state:
             raise web.HTTPError(400, "Missing OAuth state")
 
-        cookie_state = cookie_state.decode("utf-8")
-        if state != cookie_state:
-            logger.warning(f"OAuth state mismatch: {state} != {cookie_state}")
+        if not hmac.compare_digest(state.encode("utf-8"), cookie_state.encode("utf-8")):
+            logger.warning("OAuth state mismatch")
             raise web.HTTPError(403, "OAuth state mismatch")
 
         # Clear state cookie
         self.clear_cookie("oauth_state")
+        next_url = self.jupytercluster.pop_oauth_state(state)
+        if next_url is None:
+            raise web.HTTPError(403, "OAuth state expired or already used")
 
         # Get authorization code
         code = self.get_argument("code", None)
@@ -113,16 +144,8 @@ class OAuthCallbackHandler(BaseHandler):
             # Set user cookie
             self.set_secure_cookie("jupytercluster_user", username)
 
-            # Get next URL
-            next_url = self.get_secure_cookie("oauth_next")
-            if next_url:
-                next_url = next_url.decode("utf-8")
-                self.clear_cookie("oauth_next")
-            else:
-                next_url = "/"
-
             logger.info(f"User {username} logged in via OAuth")
-            self.redirect(next_url)
+            self.redirect(next_url or "/")
 
         except Exception as e:
             logger.error(f"OAuth callback error: {e}", exc_info=True)
@@ -130,47 +153,21 @@ class OAuthCallbackHandler(BaseHandler):
 
     async def _authenticate_with_oauth(self, oa, code):
         """Authenticate using OAuthenticator"""
-        # OAuthenticator's authenticate method expects a handler with specific attributes
-        # We need to create a mock handler or adapt the flow
+        # OAuthenticator's authenticate method expects a handler with specific attributes,
+        # so fall back to it (with a shim handler) when the direct methods are missing
+        token_method, user_method = _oauth_dispatch(type(oa))
 
-        # Try to use OAuthenticator's token exchange
         # Most OAuthenticators have a method to exchange code for token
-        if hasattr(oa, "token_for_code"):
-            # This is async in newer versions
-            token = await oa.token_for_code(code)
-        elif hasattr(oa, "_token_for_code"):
-            token = await oa._token_for_code(code)
-        else:
-            # Fallback: try to call authenticate directly
+        if token_method is None:
             # OAuthenticator.authenticate expects (handler, data) where data has 'code'
-            class MockHandler:
-                def __init__(self, request):
-                    self.request = request
-                    self.settings = {}
-
-            data = {"code": code}
-            result = await oa.authenticate(MockHandler(self.request), data)
-            if result:
-                return result.get("name") or result
-            return None
+            return await self._authenticate_with_data(oa, {"code": code})
+        # This is async in newer versions
+        token = await getattr(oa, token_method)(code)
 
         # Get user info from token
-        if hasattr(oa, "user_for_token"):
-            user_info = await oa.user_for_token(token)
-        elif hasattr(oa, "_user_for_token"):
-            user_info = await oa._user_for_token(token)
-        else:
-            # Try authenticate with token
-            class MockHandler:
-                def __init__(self, request):
-                    self.request = request
-                    self.settings = {}
-
-            data = {"access_token": token}
-            result = await oa.authenticate(MockHandler(self.request), data)
-            if result:
-                return result.get("name") or result
-            return None
+        if user_method is None:
+            return await self._authenticate_with_data(oa, {"access_token": token})
+        user_info = await getattr(oa, user_method)(token)
 
         if user_info:
             # Extract username from user_info
@@ -179,3 +176,10 @@ class OAuthCallbackHandler(BaseHandler):
             return str(user_info)
 
         return None
+
+    async def _authenticate_with_data(self, oa, data):
+        """Call ``oa.authenticate`` directly and extract the username"""
+        result = await oa.authenticate(_OAuthHandlerShim(self.request), data)
+        if result:
+            return result.get("name") or result
+        return None
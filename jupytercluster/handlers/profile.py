@@ -2,7 +2,7 @@
 
 import logging
 
-from .base import BaseHandler, DictObject
+from .base import BaseHandler, HubView
 
 logger = logging.getLogger(__name__)
 
@@ -18,18 +18,15 @@ class ProfileHandler(BaseHandler):
 
         app = self.jupytercluster
 
-        # Get user from database
-        from .. import orm
+        # Get user record (served from the app's short-lived user cache)
+        db_user = app.get_user(user)
 
-        db_user = app.db.query(orm.User).filter_by(name=user).first()
-
-        # Get user's hubs
+        # Get user's hubs and the namespaces they live in, in a single walk
         user_hubs = []
-        for hub_name, hub in app.hubs.items():
-            if hub.owner == user:
-                hub_dict = hub.to_dict()
-                hub_obj = DictObject(hub_dict)
-                user_hubs.append(hub_obj)
+        accessible_namespaces = []
+        for hub in app.iter_hubs_owned_by(user):
+            user_hubs.append(HubView(**hub.to_dict()))
+            accessible_namespaces.append(hub.namespace)
 
         # Get user's namespace restrictions
         allowed_namespaces = []
@@ -38,9 +35,6 @@ class ProfileHandler(BaseHandler):
             allowed_namespaces = db_user.allowed_namespaces or []
             max_hubs = db_user.max_hubs
 
-        # Get all namespaces user has access to (based on their hubs)
-        accessible_namespaces = [hub.namespace for hub in user_hubs]
-
         # Render profile page
         self.render_template(
             "profile.html",
@@ -2,74 +2,140 @@
 
 import logging
 import traceback
+from collections import ChainMap
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 
-from sqlalchemy.orm import Session
-from traitlets import Dict as TraitDict
-from traitlets import Instance, Unicode
-from traitlets.config import LoggingConfigurable
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy.orm.attributes import flag_modified
 
 from .orm import Hub as ORMHub
 from .orm import HubEvent
 from .spawner import HubSpawner
+from .utils import format_config
 
 logger = logging.getLogger(__name__)
 
 
-class HubInstance(LoggingConfigurable):
-    """High-level wrapper around an ORM Hub object"""
-
-    name = Unicode()
-    namespace = Unicode()
-    owner = Unicode()
-    helm_release_name = Unicode()
+def _orm_column(
+    name: str, default=None, writable: bool = True, doc: str = "", default_factory=None
+) -> property:
+    """Property reading (and optionally writing) a column of ``self.orm_hub``
+
+    NULL columns read as *default*. Writes that change the value go straight to
+    the ORM row (persisted by the caller's next commit) and call ``_changed``.
+
+    Mutable (JSON) columns pass *default_factory* instead. A NULL read then stores
+    a fresh ``default_factory()`` on the row, so in-place edits to it are kept,
+    and every write is flagged as a change: a dict edited in place and assigned
+    back compares equal to the row's value but still needs saving.
+    """
+
+    def fget(self):
+        value = getattr(self.orm_hub, name)
+        if value is None:
+            if default_factory is None:
+                return default
+            value = default_factory()
+            setattr(self.orm_hub, name, value)
+        return value
+
+    def fset(self, value):
+        if default_factory is not None:
+            setattr(self.orm_hub, name, value)
+            flag_modified(self.orm_hub, name)
+            self._changed(name)
+        elif getattr(self.orm_hub, name) != value:
+            setattr(self.orm_hub, name, value)
+            self._changed(name)
+
+    return property(fget, fset if writable else None, doc=doc)
+
+
+class HubInstance:
+    """High-level wrapper around an ORM Hub object
+
+    Like JupyterHub's ``User`` wrapper, hub attributes are read from and written
+    to the ORM row directly rather than copied into local state.
+    """
+
+    __slots__ = (
+        "orm_hub",
+        "spawner_class",
+        "spawner",
+        "_revision",
+        "_json_cache",
+        "_dict_cache",
+        "_values_yaml_cache",
+    )
+
+    log = logger
+
+    # Process-wide counter bumped whenever any hub changes, so list endpoints
+    # can tell cheaply whether anything they serialise has changed.
+    revision = 0
+
+    name = _orm_column("name", writable=False)
+    namespace = _orm_column("namespace", writable=False)
+    owner = _orm_column("owner", writable=False)
+    helm_release_name = _orm_column("helm_release_name", writable=False)
 
     # Configuration
-    helm_chart = Unicode("jupyterhub/jupyterhub")
-    helm_chart_version = Unicode("")
-    values = TraitDict()
+    helm_chart = _orm_column("helm_chart", "jupyterhub/jupyterhub", writable=False)
+    helm_chart_version = _orm_column("helm_chart_version", "", writable=False)
+    values = _orm_column("values", default_factory=dict, doc="Helm values override")
 
     # Status
-    status = Unicode("pending")  # pending, running, stopped, error
-    url = Unicode("")
+    status = _orm_column("status", "pending", doc="pending, running, stopped, error")
+    url = _orm_column("url", "")
 
     # Metadata
-    created = Instance(datetime)
-    last_activity = Instance(datetime)
-    description = Unicode("")
-    error_message = Unicode("")  # Last error message for debugging
+    created = _orm_column("created", writable=False)
+    last_activity = _orm_column("last_activity")
+    description = _orm_column("description", "")
+    error_message = _orm_column("error_message", "", doc="Last error message for debugging")
 
-    def __init__(self, orm_hub: ORMHub, spawner_class=HubSpawner, **kwargs):
+    def __init__(self, orm_hub: ORMHub, spawner_class=HubSpawner):
         """Initialize HubInstance from ORM Hub
 
         Args:
             orm_hub: Database model for the hub
             spawner_class: Class to use for spawning
         """
-        super().__init__(**kwargs)
         self.orm_hub = orm_hub
         self.spawner_class = spawner_class
         self.spawner = None
-
-        # Load attributes from ORM
-        self._load_from_orm()
-
-    def _load_from_orm(self):
-        """Load attributes from ORM object"""
-        self.name = self.orm_hub.name
-        self.namespace = self.orm_hub.namespace
-        self.owner = self.orm_hub.owner
-        self.helm_release_name = self.orm_hub.helm_release_name
-        self.helm_chart = self.orm_hub.helm_chart
-        self.helm_chart_version = self.orm_hub.helm_chart_version or ""
-        self.values = self.orm_hub.values or {}
-        self.status = self.orm_hub.status
-        self.url = self.orm_hub.url or ""
-        self.created = self.orm_hub.created
-        self.last_activity = self.orm_hub.last_activity
-        self.description = self.orm_hub.description or ""
-        self.error_message = getattr(self.orm_hub, "error_message", None) or ""
+        # Serialised to_dict() output, filled lazily by to_json()
+        self._json_cache: Optional[bytes] = None
+        # to_dict() output; callers get a copy
+        self._dict_cache: Optional[Dict] = None
+        # YAML rendering of ``values`` for the edit form
+        self._values_yaml_cache: Optional[str] = None
+        # Value of ``revision`` at this hub's most recent change (per-hub version).
+        # Taken fresh here, so a re-created instance never repeats the version
+        # (and ETag) of an earlier instance for the same hub.
+        self._changed()
+
+    def _changed(self, name: Optional[str] = None):
+        """Record a change to attribute *name* (None: the whole row) and drop caches"""
+        HubInstance.revision += 1
+        self._revision = HubInstance.revision
+        self._json_cache = None
+        self._dict_cache = None
+        if name is None or name == "values":
+            self._values_yaml_cache = None
+
+    @property
+    def version(self) -> int:
+        """Opaque value that changes whenever this hub changes"""
+        return self._revision
+
+    @property
+    def values_yaml(self) -> str:
+        """Helm values formatted as YAML, cached until ``values`` is reassigned"""
+        if self._values_yaml_cache is None:
+            self._values_yaml_cache = format_config(self.values, format="yaml")
+        return self._values_yaml_cache
 
     def get_spawner(self) -> HubSpawner:
         """Get or create spawner for this hub"""
@@ -94,21 +160,17 @@ class HubInstance(LoggingConfigurable):
         """Start the hub instance"""
         self.log.info(f"Starting hub {self.name}")
 
-        # Merge values
-        merged_values = {**self.values}
-        if values:
-            merged_values.update(values)
+        # Overrides read through to the stored values; the spawner copies the
+        # whitelisted keys out, so there is no need to build a merged dict here
+        merged_values = ChainMap(values, self.values) if values else self.values
 
         spawner = self.get_spawner()
 
         # Clear any previous error before attempting to start
         self.error_message = ""
-        if hasattr(self.orm_hub, "error_message"):
-            self.orm_hub.error_message = ""
 
         # Update status
         self.status = "pending"
-        self._save_to_orm()
 
         try:
             namespace, url = await spawner.start(values=merged_values)
@@ -117,7 +179,6 @@ class HubInstance(LoggingConfigurable):
             self.status = "running"
             self.url = url
             self.last_activity = datetime.utcnow()
-            self._save_to_orm()
             self._log_event("started", f"Hub started successfully at {url}")
 
             self.log.info(f"Hub {self.name} started successfully at {url}")
@@ -126,9 +187,8 @@ class HubInstance(LoggingConfigurable):
             error_traceback = traceback.format_exc()
             full_error = f"{error_msg}\n\nTraceback:\n{error_traceback}"
 
-            self.log.error(f"Failed to start hub {self.name}: {e}")
+            self.log.exception("Failed to start hub %s", self.name)
             self.status = "error"
-            self._save_to_orm()
 
             # Store error event in database
             self._log_error_event("start", full_error)
@@ -145,7 +205,6 @@ class HubInstance(LoggingConfigurable):
 
             self.status = "stopped"
             self.last_activity = datetime.utcnow()
-            self._save_to_orm()
             self._log_event("stopped", "Hub stopped successfully")
 
             self.log.info(f"Hub {self.name} stopped successfully")
@@ -154,9 +213,8 @@ class HubInstance(LoggingConfigurable):
             error_traceback = traceback.format_exc()
             full_error = f"{error_msg}\n\nTraceback:\n{error_traceback}"
 
-            self.log.error(f"Failed to stop hub {self.name}: {e}")
+            self.log.exception("Failed to stop hub %s", self.name)
             self.status = "error"
-            self._save_to_orm()
 
             # Store error event in database
             self._log_error_event("stop", full_error)
@@ -168,30 +226,25 @@ class HubInstance(LoggingConfigurable):
         spawner = self.get_spawner()
         return await spawner.poll()
 
-    def _save_to_orm(self):
-        """Save current state to ORM object"""
-        self.orm_hub.status = self.status
-        self.orm_hub.url = self.url
-        self.orm_hub.last_activity = self.last_activity
-        self.orm_hub.values = self.values
-        if self.description:
-            self.orm_hub.description = self.description
-        # Save error message if it exists
-        if hasattr(self, "error_message"):
-            if hasattr(self.orm_hub, "error_message"):
-                self.orm_hub.error_message = self.error_message
+    def _add_event(self, event_type: str, message: str):
+        """Queue a HubEvent row for this hub, committed with the caller's next commit
+
+        Persistent hubs get the row added to their session directly, so the
+        ``events`` collection (the hub's whole history) is never loaded just to
+        append to it.
+        """
+        event = HubEvent(event_type=event_type, message=message)
+        session = object_session(self.orm_hub)
+        if session is not None and self.orm_hub.id is not None:
+            event.hub_id = self.orm_hub.id
+            session.add(event)
+        else:
+            self.orm_hub.events.append(event)
 
     def _log_event(self, event_type: str, message: str):
         """Append a lifecycle event to this hub's event log."""
         try:
-            self.orm_hub.events.append(
-                HubEvent(
-                    hub_id=self.orm_hub.id,
-                    event_type=event_type,
-                    message=message,
-                    timestamp=datetime.utcnow(),
-                )
-            )
+            self._add_event(event_type, message)
         except Exception as e:
             self.log.warning("Could not create hub event (%s): %s", event_type, e)
 
@@ -199,21 +252,11 @@ class HubInstance(LoggingConfigurable):
         """Log an error event - store in ORM object for later commit"""
         # Store error message on the hub's ORM object
         self.error_message = f"[{operation}] {error_message}"
-        if hasattr(self.orm_hub, "error_message"):
-            self.orm_hub.error_message = self.error_message
 
-        # Also try to create a HubEvent if we can access the session
-        # This is a best-effort - if session isn't available, error_message field will have it
+        # Also record a HubEvent. This is best-effort - if it fails, the
+        # error_message field still has the details
         try:
-            # Try to add event via relationship
-            error_event = HubEvent(
-                hub_id=self.orm_hub.id,
-                event_type="error",
-                message=f"{operation}: {error_message}",
-                timestamp=datetime.utcnow(),
-            )
-            # Add to the relationship - will be committed when session commits
-            self.orm_hub.events.append(error_event)
+            self._add_event("error", f"{operation}: {error_message}")
         except Exception as e:
             # If we can't add event, at least we have error_message
             self.log.warning(
@@ -221,7 +264,22 @@ class HubInstance(LoggingConfigurable):
             )
 
     def to_dict(self) -> Dict:
-        """Convert to dictionary for API responses and templates"""
+        """Convert to dictionary for API responses and templates
+
+        The dict is built once per change to the hub; a shallow copy is returned
+        so callers can add keys (e.g. ``values_yaml``) without touching the cache.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return dict(self._dict_cache)
+
+    def to_json(self, dumps: Callable[[Dict], bytes]) -> bytes:
+        """``to_dict()`` serialised with *dumps*, cached until the hub changes"""
+        if self._json_cache is None:
+            self._json_cache = dumps(self.to_dict())
+        return self._json_cache
+
+    def _build_dict(self) -> Dict:
         return {
             "name": self.name,
             "namespace": self.namespace,
@@ -229,7 +287,7 @@ class HubInstance(LoggingConfigurable):
             "helm_release_name": self.helm_release_name,
             "helm_chart": self.helm_chart,
             "helm_chart_version": self.helm_chart_version,
-            "status": str(self.status),  # Ensure status is a string
+            "status": self.status,
             "url": self.url,
             "created": self.created.isoformat() if self.created else None,
             "last_activity": self.last_activity.isoformat() if self.last_activity else None,
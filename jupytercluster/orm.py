@@ -5,9 +5,8 @@ import secrets
 from datetime import datetime
 from typing import List, Optional, Tuple
 
-from sqlalchemy import JSON, Boolean, Column, DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy import JSON, Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
 
@@ -43,7 +42,11 @@ class Hub(Base):
     description = Column(Text)
 
     # Relationships
-    events = relationship("HubEvent", back_populates="hub", cascade="all, delete-orphan")
+    # passive_deletes: deleting a hub must not load its whole event history;
+    # delete_hub removes the events with one bulk DELETE instead
+    events = relationship(
+        "HubEvent", back_populates="hub", cascade="all, delete-orphan", passive_deletes=True
+    )
 
     def __repr__(self):
         return f"<Hub(name={self.name}, namespace={self.namespace}, owner={self.owner})>"
@@ -53,6 +56,8 @@ class HubEvent(Base):
     """Events/logs for hub operations"""
 
     __tablename__ = "hub_events"
+    # Per-hub timelines (newest first) are read as one range of this index
+    __table_args__ = (Index("ix_hub_events_hub_ts", "hub_id", "timestamp"),)
 
     id = Column(Integer, primary_key=True)
     hub_id = Column(Integer, ForeignKey("hubs.id"), nullable=False)
@@ -3,17 +3,24 @@
 import asyncio
 import json
 import logging
+import os
+import random
 import subprocess
-import tempfile
-from pathlib import Path
-from typing import Dict, Optional, Tuple
+import time
+import weakref
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Dict, List, Mapping, Optional, Tuple
 
+import yaml
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
 from traitlets import Dict as TraitDict
 from traitlets import Integer, Unicode, default
 from traitlets.config import LoggingConfigurable
 
+from .utils import SafeDumper
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +39,59 @@ def _deep_merge(base: Dict, override: Dict) -> Dict:
     return result
 
 
+@lru_cache(maxsize=None)
+def _k8s_api_client(kubeconfig_path: str) -> client.ApiClient:
+    """Load the Kubernetes config once and return a process-wide ApiClient
+
+    Every spawner talking to the same cluster shares one ApiClient, and with it
+    one urllib3 connection pool, instead of re-reading the kubeconfig and opening
+    fresh connections for each hub.  Failures are not cached.
+    """
+    if kubeconfig_path:
+        config.load_kube_config(config_file=kubeconfig_path)
+    else:
+        config.load_incluster_config()
+    return client.ApiClient()
+
+
+# (kubeconfig_path, kind) -> (fetched at, data); shared by all spawners
+_cluster_lists: Dict[Tuple[str, str], Tuple[float, object]] = {}
+
+# securityContext fields users may not set on singleuser pods
+_DANGEROUS_SECURITY_CONTEXT_KEYS = frozenset(
+    {"privileged", "allowPrivilegeEscalation", "capabilities"}
+)
+
+# Lines of helm output kept per stream for error messages
+_HELM_OUTPUT_TAIL = 200
+
+# helm repo URL -> time of its last successful ``helm repo update``
+_helm_repo_updated: Dict[str, float] = {}
+
+# Bound on concurrent helm processes across all spawners; see set_helm_concurrency
+_helm_concurrency = 8
+# One semaphore and one repo-refresh lock per event loop, since asyncio
+# primitives are tied to a loop on Python < 3.10
+_helm_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+_helm_repo_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def set_helm_concurrency(limit: int) -> None:
+    """Run at most *limit* helm processes at once across all spawners
+
+    Called by JupyterCluster from its ``helm_concurrency`` setting. Semaphores are
+    rebuilt at the new size on next use, and repo-refresh locks along with them.
+    """
+    global _helm_concurrency
+    _helm_concurrency = limit
+    _helm_semaphores.clear()
+    _helm_repo_locks.clear()
+
+
 class HubSpawner(LoggingConfigurable):
     """Spawns JupyterHub instances as Helm releases in Kubernetes namespaces"""
 
@@ -51,12 +111,22 @@ class HubSpawner(LoggingConfigurable):
         help="Helm repository URL for JupyterHub chart",
     ).tag(config=True)
 
+    helm_repo_update_interval = Integer(
+        300,
+        help="Seconds between `helm repo update` runs; spawns in between reuse the local index",
+    ).tag(config=True)
+
     # Kubernetes configuration
     kubeconfig_path = Unicode(
         "",
         help="Path to kubeconfig file (empty for in-cluster config)",
     ).tag(config=True)
 
+    cluster_cache_ttl = Integer(
+        30,
+        help="Seconds to reuse the cluster's StorageClass and Node lists when validating hub values",
+    ).tag(config=True)
+
     # Default Helm values
     default_values = TraitDict(
         {},
@@ -71,8 +141,6 @@ class HubSpawner(LoggingConfigurable):
 
     def _get_allow_namespace_creation(self) -> bool:
         """Get allow_namespace_creation as boolean"""
-        import os
-
         # Check environment variable first
         env_value = os.environ.get("JUPYTERCLUSTER_ALLOW_NAMESPACE_CREATION", None)
         if env_value is not None:
@@ -125,30 +193,53 @@ class HubSpawner(LoggingConfigurable):
         # Initialize Kubernetes client
         self._init_k8s_client()
 
+    @property
+    def _release_selector(self) -> str:
+        """Label selector for the objects the JupyterHub chart creates for this release"""
+        return f"release={self.helm_release_name}"
+
+    @property
+    def _hub_pod_selector(self) -> str:
+        """Label selector for this release's hub and proxy pods (not user servers)"""
+        return f"{self._release_selector},component in (hub,proxy)"
+
     def _init_k8s_client(self):
         """Initialize Kubernetes API client"""
         try:
-            if self.kubeconfig_path:
-                config.load_kube_config(config_file=self.kubeconfig_path)
-            else:
-                config.load_incluster_config()
-            self.k8s_client = client.ApiClient()
-            self.core_v1 = client.CoreV1Api()
-            self.apps_v1 = client.AppsV1Api()
-            self.storage_v1 = client.StorageV1Api()
+            self.k8s_client = _k8s_api_client(self.kubeconfig_path)
+            self.core_v1 = client.CoreV1Api(self.k8s_client)
+            self.apps_v1 = client.AppsV1Api(self.k8s_client)
+            self.storage_v1 = client.StorageV1Api(self.k8s_client)
+            self.networking_v1 = client.NetworkingV1Api(self.k8s_client)
         except Exception as e:
             self.log.error(f"Failed to initialize Kubernetes client: {e}")
             raise
 
+    async def _cached_cluster_list(self, kind: str, list_fn, extract):
+        """Return ``extract(list_fn())``, reusing a result younger than cluster_cache_ttl
+
+        StorageClasses and Nodes change rarely, but every spawn validates against
+        them; caching the extracted data process-wide means a burst of spawns
+        costs one LIST per kind instead of one (or more) per hub.
+        """
+        key = (self.kubeconfig_path, kind)
+        cached = _cluster_lists.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.cluster_cache_ttl:
+            return cached[1]
+        loop = asyncio.get_event_loop()
+        data = extract(await loop.run_in_executor(None, list_fn))
+        _cluster_lists[key] = (time.monotonic(), data)
+        return data
+
     async def _check_storage_class_exists(self, storage_class: str) -> bool:
         """Check if a storage class exists in the cluster"""
         try:
-            loop = asyncio.get_event_loop()
-            storage_classes = await loop.run_in_executor(None, self.storage_v1.list_storage_class)
-            for sc in storage_classes.items:
-                if sc.metadata.name == storage_class:
-                    return True
-            return False
+            names = await self._cached_cluster_list(
+                "storageclasses",
+                self.storage_v1.list_storage_class,
+                lambda result: frozenset(sc.metadata.name for sc in result.items),
+            )
+            return storage_class in names
         except Exception as e:
             self.log.warning(f"Failed to check storage class {storage_class}: {e}")
             return False
@@ -163,10 +254,12 @@ class HubSpawner(LoggingConfigurable):
             True if at least one node has all required labels
         """
         try:
-            loop = asyncio.get_event_loop()
-            nodes = await loop.run_in_executor(None, self.core_v1.list_node)
-            for node in nodes.items:
-                node_labels = node.metadata.labels or {}
+            all_node_labels = await self._cached_cluster_list(
+                "nodes",
+                self.core_v1.list_node,
+                lambda result: tuple(node.metadata.labels or {} for node in result.items),
+            )
+            for node_labels in all_node_labels:
                 # Check if any node has all required labels
                 has_all = True
                 for key, value in required_labels.items():
@@ -188,7 +281,7 @@ class HubSpawner(LoggingConfigurable):
             self.log.warning(f"Failed to check node labels: {e}")
             return False
 
-    def _validate_helm_values(self, values: Dict) -> Dict:
+    def _validate_helm_values(self, values: Mapping) -> Dict:
         """Validate and sanitize Helm values to prevent security issues
 
         CRITICAL SECURITY: This prevents users from:
@@ -203,14 +296,14 @@ class HubSpawner(LoggingConfigurable):
         Returns:
             Sanitized values dict
         """
-        sanitized = {}
-
-        # Only allow whitelisted top-level keys
-        for key in values:
-            if key in self.allowed_helm_keys:
-                sanitized[key] = values[key]
-            else:
-                self.log.warning(f"Rejected Helm key: {key} (not in whitelist)")
+        # Only allow whitelisted top-level keys (read the trait once, not per key)
+        allowed_keys = self.allowed_helm_keys
+        sanitized = {key: values[key] for key in values if key in allowed_keys}
+        if len(sanitized) != len(values):
+            rejected = [key for key in values if key not in allowed_keys]
+            self.log.warning(
+                f"Rejected Helm keys: {', '.join(map(str, rejected))} (not in whitelist)"
+            )
 
         # CRITICAL: Remove any namespace from values
         # Namespace is controlled via --namespace flag in Helm command, not in values
@@ -239,35 +332,15 @@ class HubSpawner(LoggingConfigurable):
                 if "securityContext" in singleuser:
                     sc = singleuser["securityContext"]
                     if isinstance(sc, dict):
-                        for dangerous_key in [
-                            "privileged",
-                            "allowPrivilegeEscalation",
-                            "capabilities",
-                        ]:
-                            if dangerous_key in sc:
-                                self.log.warning(
-                                    f"Removed dangerous securityContext.{dangerous_key}"
-                                )
-                                del sc[dangerous_key]
+                        for dangerous_key in _DANGEROUS_SECURITY_CONTEXT_KEYS.intersection(sc):
+                            self.log.warning(f"Removed dangerous securityContext.{dangerous_key}")
+                            del sc[dangerous_key]
 
                 # Fix storage.extraVolumes and extraVolumeMounts - convert empty maps to empty lists
                 if "storage" in singleuser:
                     storage = singleuser["storage"]
                     if isinstance(storage, dict):
-                        if (
-                            "extraVolumes" in storage
-                            and isinstance(storage["extraVolumes"], dict)
-                            and len(storage["extraVolumes"]) == 0
-                        ):
-                            self.log.warning("Converting empty extraVolumes map to empty list")
-                            storage["extraVolumes"] = []
-                        if (
-                            "extraVolumeMounts" in storage
-                            and isinstance(storage["extraVolumeMounts"], dict)
-                            and len(storage["extraVolumeMounts"]) == 0
-                        ):
-                            self.log.warning("Converting empty extraVolumeMounts map to empty list")
-                            storage["extraVolumeMounts"] = []
+                        self._fix_empty_volume_maps(storage)
 
                         # Storage class validation is done async in _deploy_helm_release
 
@@ -275,7 +348,14 @@ class HubSpawner(LoggingConfigurable):
 
         return sanitized
 
-    async def start(self, values: Optional[Dict] = None) -> Tuple[str, str]:
+    def _fix_empty_volume_maps(self, storage: Dict):
+        """Convert empty ``extraVolumes``/``extraVolumeMounts`` maps to the lists the chart expects"""
+        for key in ("extraVolumes", "extraVolumeMounts"):
+            if isinstance(storage.get(key), dict) and not storage[key]:
+                self.log.warning(f"Converting empty {key} map to empty list")
+                storage[key] = []
+
+    async def start(self, values: Optional[Mapping] = None) -> Tuple[str, str]:
         """Start a JupyterHub instance
 
         Args:
@@ -291,10 +371,8 @@ class HubSpawner(LoggingConfigurable):
 
         # Start with global defaults from JUPYTERCLUSTER_DEFAULT_HUB_VALUES env var.
         # These are applied first so that hub-specific values can override them.
-        import os as _os
-
         merged_values: Dict = {}
-        _global_defaults_raw = _os.environ.get("JUPYTERCLUSTER_DEFAULT_HUB_VALUES")
+        _global_defaults_raw = os.environ.get("JUPYTERCLUSTER_DEFAULT_HUB_VALUES")
         if _global_defaults_raw:
             try:
                 merged_values = json.loads(_global_defaults_raw)
@@ -313,7 +391,7 @@ class HubSpawner(LoggingConfigurable):
             merged_values = _deep_merge(merged_values, sanitized_values)
 
         # Apply schema-defined fixed values last so they always win (server-side enforcement)
-        _schema_raw = _os.environ.get("JUPYTERCLUSTER_HUB_VALUES_SCHEMA")
+        _schema_raw = os.environ.get("JUPYTERCLUSTER_HUB_VALUES_SCHEMA")
         if _schema_raw:
             try:
                 _schema = json.loads(_schema_raw)
@@ -326,17 +404,6 @@ class HubSpawner(LoggingConfigurable):
             except (json.JSONDecodeError, AttributeError):
                 pass
 
-        # Ensure required schema fields are present (JupyterHub Helm chart requires these)
-        # These must be present even if empty to satisfy schema validation
-        required_fields = {"hub": {}, "proxy": {}, "singleuser": {}, "ingress": {}}
-        for field, default_value in required_fields.items():
-            if field not in merged_values:
-                merged_values[field] = default_value
-            elif not isinstance(merged_values[field], dict):
-                # If it's not a dict, make it a dict (shouldn't happen, but be safe)
-                self.log.warning(f"Field '{field}' is not a dict, converting to dict")
-                merged_values[field] = default_value
-
         # Auto-enable ingress/httpRoute when hosts are configured but enabled flag is missing.
         # This handles hubs created before the hostname field was added, and guards against the
         # form omitting the enabled flag (which would silently skip Ingress/HTTPRoute creation).
@@ -391,11 +458,15 @@ class HubSpawner(LoggingConfigurable):
                     return 1  # Namespace doesn't exist, hub is stopped
                 raise
 
-            # Check if Helm release exists by checking for hub pods
+            # Check if Helm release exists by checking for hub pods; the chart labels
+            # them, so let the apiserver filter rather than listing every pod
             pods = await loop.run_in_executor(
-                None, lambda: self.core_v1.list_namespaced_pod(namespace=self.namespace)
+                None,
+                lambda: self.core_v1.list_namespaced_pod(
+                    namespace=self.namespace, label_selector=self._hub_pod_selector
+                ),
             )
-            hub_pods = [p for p in pods.items if "jupyterhub" in p.metadata.name.lower()]
+            hub_pods = pods.items
 
             if not hub_pods:
                 return 1  # No hub pods, consider it stopped
@@ -431,33 +502,27 @@ class HubSpawner(LoggingConfigurable):
                 raise
 
         # Namespace creation is allowed - proceed with creation logic
+        labels = {
+            "jupytercluster.io/managed": "true",
+            "jupytercluster.io/hub": self.hub_name,
+            "jupytercluster.io/owner": self.owner,
+        }
         try:
-            ns = await loop.run_in_executor(
-                None, lambda: self.core_v1.read_namespace(name=self.namespace)
-            )
-            # Update labels to ensure ownership
-            ns.metadata.labels.update(
-                {
-                    "jupytercluster.io/managed": "true",
-                    "jupytercluster.io/hub": self.hub_name,
-                    "jupytercluster.io/owner": self.owner,
-                }
-            )
+            # Update labels to ensure ownership; a labels-only merge patch needs no
+            # prior read and leaves labels set by anyone else untouched
             await loop.run_in_executor(
-                None, lambda: self.core_v1.patch_namespace(name=self.namespace, body=ns)
+                None,
+                lambda: self.core_v1.patch_namespace(
+                    name=self.namespace,
+                    body={"metadata": {"labels": labels}},
+                    _content_type="application/merge-patch+json",
+                ),
             )
             self.log.debug(f"Namespace {self.namespace} already exists, updated labels")
         except ApiException as e:
             if e.status == 404:
                 namespace_body = client.V1Namespace(
-                    metadata=client.V1ObjectMeta(
-                        name=self.namespace,
-                        labels={
-                            "jupytercluster.io/managed": "true",
-                            "jupytercluster.io/hub": self.hub_name,
-                            "jupytercluster.io/owner": self.owner,
-                        },
-                    ),
+                    metadata=client.V1ObjectMeta(name=self.namespace, labels=labels),
                 )
                 await loop.run_in_executor(
                     None, lambda: self.core_v1.create_namespace(body=namespace_body)
@@ -466,6 +531,61 @@ class HubSpawner(LoggingConfigurable):
             else:
                 raise
 
+    async def _run_helm(self, cmd: List[str], input: Optional[bytes] = None) -> Tuple[int, str]:
+        """Run a helm command, logging its output as it is produced
+
+        Only the last ``_HELM_OUTPUT_TAIL`` lines of each stream are kept, so memory
+        stays flat however verbose helm is. At most ``JupyterCluster.helm_concurrency``
+        helm processes run at once; bulk starts and stops queue for a slot.
+
+        Returns:
+            Tuple of (exit code, tail of stderr - or of stdout if stderr was empty)
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = _helm_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = _helm_semaphores[loop] = asyncio.Semaphore(_helm_concurrency)
+
+        async with semaphore:
+            return await self._run_helm_process(cmd, input)
+
+    async def _run_helm_process(
+        self, cmd: List[str], input: Optional[bytes] = None
+    ) -> Tuple[int, str]:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE if input is not None else None,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        debug = self.log.isEnabledFor(logging.DEBUG)
+        stdout_tail: Deque[bytes] = deque(maxlen=_HELM_OUTPUT_TAIL)
+        stderr_tail: Deque[bytes] = deque(maxlen=_HELM_OUTPUT_TAIL)
+
+        async def _drain(stream, tail):
+            async for line in stream:
+                tail.append(line)
+                if debug:
+                    self.log.debug("helm: %s", line.decode(errors="replace").rstrip())
+
+        async def _feed():
+            try:
+                process.stdin.write(input)
+                await process.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # helm exited early; its exit code and stderr say why
+            finally:
+                process.stdin.close()
+
+        pipes = [_drain(process.stdout, stdout_tail), _drain(process.stderr, stderr_tail)]
+        if input is not None:
+            pipes.append(_feed())
+        await asyncio.gather(*pipes)
+        returncode = await process.wait()
+        if returncode == 0:
+            return returncode, ""
+        return returncode, b"".join(stderr_tail or stdout_tail).decode(errors="replace")
+
     async def _deploy_helm_release(self, values: Dict):
         """Deploy Helm release using helm CLI (via subprocess)"""
         self.log.info(
@@ -492,24 +612,7 @@ class HubSpawner(LoggingConfigurable):
                 values["singleuser"]["storage"], dict
             ):
                 storage = values["singleuser"]["storage"]
-                if (
-                    "extraVolumes" in storage
-                    and isinstance(storage["extraVolumes"], dict)
-                    and len(storage["extraVolumes"]) == 0
-                ):
-                    self.log.warning(
-                        "Converting empty extraVolumes map to empty list (final sanitization)"
-                    )
-                    storage["extraVolumes"] = []
-                if (
-                    "extraVolumeMounts" in storage
-                    and isinstance(storage["extraVolumeMounts"], dict)
-                    and len(storage["extraVolumeMounts"]) == 0
-                ):
-                    self.log.warning(
-                        "Converting empty extraVolumeMounts map to empty list (final sanitization)"
-                    )
-                    storage["extraVolumeMounts"] = []
+                self._fix_empty_volume_maps(storage)
 
                 # Final check: Validate storage class exists
                 if "dynamic" in storage and isinstance(storage["dynamic"], dict):
@@ -558,115 +661,79 @@ class HubSpawner(LoggingConfigurable):
                         )
                         values["singleuser"]["extraNodeAffinity"] = {}
 
-        # Create temporary values file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            import yaml
+        # Helm reads the values from stdin, so nothing is written to disk
+        values_yaml = yaml.dump(values, Dumper=SafeDumper).encode()
+
+        # Build helm upgrade --install command
+        cmd = [
+            "helm",
+            "upgrade",
+            "--install",
+            "--cleanup-on-fail",  # Roll back newly created resources if upgrade fails
+            self.helm_release_name,
+            self.helm_chart,
+            "--namespace",
+            self.namespace,
+            "--values",
+            "-",
+        ]
 
-            yaml.dump(values, f)
-            values_file = f.name
+        # Only ask Helm to create the namespace when the service account
+        # has permission to do so.  When namespace creation is disabled,
+        # the namespace must already exist.
+        if self._get_allow_namespace_creation():
+            cmd.insert(cmd.index("--values"), "--create-namespace")
 
-        try:
-            # Build helm upgrade --install command
-            cmd = [
-                "helm",
-                "upgrade",
-                "--install",
-                "--cleanup-on-fail",  # Roll back newly created resources if upgrade fails
-                self.helm_release_name,
-                self.helm_chart,
-                "--namespace",
-                self.namespace,
-                "--values",
-                values_file,
-            ]
-
-            # Only ask Helm to create the namespace when the service account
-            # has permission to do so.  When namespace creation is disabled,
-            # the namespace must already exist.
-            if self._get_allow_namespace_creation():
-                cmd.insert(cmd.index("--values"), "--create-namespace")
-
-            # Add chart version if specified
-            if self.helm_chart_version:
-                cmd.extend(["--version", self.helm_chart_version])
-
-            # Add repo if chart doesn't contain /
-            if "/" not in self.helm_chart:
-                cmd.extend(["--repo", self.helm_repo_url])
-
-            self.log.debug(f"Running: {' '.join(cmd)}")
-
-            # Run helm command
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+        # Add chart version if specified
+        if self.helm_chart_version:
+            cmd.extend(["--version", self.helm_chart_version])
 
-            stdout, stderr = await process.communicate()
+        # Add repo if chart doesn't contain /
+        if "/" not in self.helm_chart:
+            cmd.extend(["--repo", self.helm_repo_url])
 
-            if process.returncode != 0:
-                error_msg = stderr.decode() if stderr else stdout.decode()
-                self.log.error(f"Helm deployment failed: {error_msg}")
+        self.log.debug(f"Running: {' '.join(cmd)}")
 
-                # Recover from a release stuck in "pending-install" state.
-                # This happens when a previous install was interrupted before
-                # Helm could record a successful revision.
-                if "release: already exists" in error_msg or (
-                    "cannot re-use a name that is still in use" in error_msg
-                ):
-                    self.log.warning(
-                        f"Release {self.helm_release_name} is stuck in pending state — "
-                        "attempting rollback then retry."
-                    )
-                    # Try rollback first (cheaper than uninstall)
-                    rollback = await asyncio.create_subprocess_exec(
-                        "helm",
-                        "rollback",
-                        self.helm_release_name,
-                        "--namespace",
-                        self.namespace,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
-                    )
-                    await rollback.communicate()
-                    if rollback.returncode != 0:
-                        # No prior revision to roll back to — uninstall instead
-                        self.log.warning(f"Rollback failed, uninstalling {self.helm_release_name}…")
-                        uninstall = await asyncio.create_subprocess_exec(
-                            "helm",
-                            "uninstall",
-                            self.helm_release_name,
-                            "--namespace",
-                            self.namespace,
-                            stdout=asyncio.subprocess.PIPE,
-                            stderr=asyncio.subprocess.PIPE,
-                        )
-                        await uninstall.communicate()
-
-                    # Retry deployment
-                    self.log.info("Retrying Helm deployment after recovery…")
-                    retry = await asyncio.create_subprocess_exec(
-                        *cmd,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
-                    )
-                    r_stdout, r_stderr = await retry.communicate()
-                    if retry.returncode != 0:
-                        error_msg = r_stderr.decode() if r_stderr else r_stdout.decode()
-                        raise RuntimeError(f"Helm deployment failed after recovery: {error_msg}")
-                    self.log.info(
-                        f"Helm release {self.helm_release_name} deployed successfully after recovery"
+        # Run helm command
+        returncode, error_msg = await self._run_helm(cmd, input=values_yaml)
+
+        if returncode != 0:
+            self.log.error(f"Helm deployment failed: {error_msg}")
+
+            # Recover from a release stuck in "pending-install" state.
+            # This happens when a previous install was interrupted before
+            # Helm could record a successful revision.
+            if "release: already exists" in error_msg or (
+                "cannot re-use a name that is still in use" in error_msg
+            ):
+                self.log.warning(
+                    f"Release {self.helm_release_name} is stuck in pending state — "
+                    "attempting rollback then retry."
+                )
+                # Try rollback first (cheaper than uninstall)
+                rollback_code, _ = await self._run_helm(
+                    ["helm", "rollback", self.helm_release_name, "--namespace", self.namespace]
+                )
+                if rollback_code != 0:
+                    # No prior revision to roll back to — uninstall instead
+                    self.log.warning(f"Rollback failed, uninstalling {self.helm_release_name}…")
+                    await self._run_helm(
+                        ["helm", "uninstall", self.helm_release_name, "--namespace", self.namespace]
                     )
-                    return
 
-                raise RuntimeError(f"Helm deployment failed: {error_msg}")
+                # Retry deployment
+                self.log.info("Retrying Helm deployment after recovery…")
+                retry_code, error_msg = await self._run_helm(cmd, input=values_yaml)
+                if retry_code != 0:
+                    raise RuntimeError(f"Helm deployment failed after recovery: {error_msg}")
+                self.log.info(
+                    f"Helm release {self.helm_release_name} deployed successfully after recovery"
+                )
+                return
 
-            self.log.info(f"Helm release {self.helm_release_name} deployed successfully")
+            raise RuntimeError(f"Helm deployment failed: {error_msg}")
 
-        finally:
-            # Clean up temp file
-            Path(values_file).unlink(missing_ok=True)
+        self.log.info(f"Helm release {self.helm_release_name} deployed successfully")
 
     async def _delete_namespace(self, namespace: str):
         """Delete a Kubernetes namespace.
@@ -694,27 +761,33 @@ class HubSpawner(LoggingConfigurable):
                 raise
 
     async def _ensure_helm_repo(self):
-        """Ensure Helm repository is added"""
-        repo_name = "jupyterhub"
-        cmd = ["helm", "repo", "add", repo_name, self.helm_repo_url]
+        """Ensure Helm repository is added
 
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        The add/update pair runs at most once per helm_repo_update_interval per
+        process; concurrent spawns wait for the refresh in flight instead of
+        running their own ``helm repo update`` against the same index.
+        """
+        loop = asyncio.get_running_loop()
+        lock = _helm_repo_locks.get(loop)
+        if lock is None:
+            lock = _helm_repo_locks[loop] = asyncio.Lock()
+
+        async with lock:
+            last_update = _helm_repo_updated.get(self.helm_repo_url)
+            if (
+                last_update is not None
+                and time.monotonic() - last_update < self.helm_repo_update_interval
+            ):
+                return
 
-        await process.communicate()
-        # Ignore error if repo already exists
+            repo_name = "jupyterhub"
+            # Ignore error if repo already exists
+            await self._run_helm(["helm", "repo", "add", repo_name, self.helm_repo_url])
 
-        # Update repo
-        cmd = ["helm", "repo", "update", repo_name]
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        await process.communicate()
+            # Update repo
+            returncode, _ = await self._run_helm(["helm", "repo", "update", repo_name])
+            if returncode == 0:
+                _helm_repo_updated[self.helm_repo_url] = time.monotonic()
 
     async def _delete_helm_release(self):
         """Delete Helm release"""
@@ -728,16 +801,9 @@ class HubSpawner(LoggingConfigurable):
             self.namespace,
         ]
 
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-
-        stdout, stderr = await process.communicate()
+        returncode, error_msg = await self._run_helm(cmd)
 
-        if process.returncode != 0:
-            error_msg = stderr.decode() if stderr else stdout.decode()
+        if returncode != 0:
             # Ignore "release not found" errors
             if "not found" not in error_msg.lower():
                 self.log.error(f"Helm deletion failed: {error_msg}")
@@ -765,17 +831,25 @@ class HubSpawner(LoggingConfigurable):
         """Wait for hub to be ready and return its URL"""
         self.log.info(f"Waiting for hub {self.hub_name} to be ready...")
 
-        # Wait for proxy service to be ready
+        # Wait for proxy service to be ready. Poll quickly at first (the service
+        # usually exists as soon as helm returns), backing off to the old fixed
+        # interval with jitter so concurrent spawns don't poll in lockstep.
         max_wait = self.start_timeout
-        wait_interval = 5
-        elapsed = 0
+        max_interval = 5
+        attempt = 0
+        started = time.monotonic()
+        loop = asyncio.get_event_loop()
 
-        while elapsed < max_wait:
+        while time.monotonic() - started < max_wait:
+            wait_interval = min(max_interval, 0.25 * 1.6**attempt) + random.uniform(0, 0.25)
+            attempt += 1
             try:
-                loop = asyncio.get_event_loop()
                 # Check for proxy service
                 services = await loop.run_in_executor(
-                    None, lambda: self.core_v1.list_namespaced_service(namespace=self.namespace)
+                    None,
+                    lambda: self.core_v1.list_namespaced_service(
+                        namespace=self.namespace, label_selector=self._release_selector
+                    ),
                 )
                 proxy_service = None
                 for svc in services.items:
@@ -787,20 +861,21 @@ class HubSpawner(LoggingConfigurable):
                     # Check for ingress or construct URL from service
                     # Try to get ingress first
                     try:
-                        from kubernetes.client import NetworkingV1Api
-
-                        net_v1 = NetworkingV1Api()
-                        loop2 = asyncio.get_event_loop()
-                        ingresses = await loop2.run_in_executor(
-                            None, lambda: net_v1.list_namespaced_ingress(namespace=self.namespace)
+                        ingresses = await loop.run_in_executor(
+                            None,
+                            lambda: self.networking_v1.list_namespaced_ingress(
+                                namespace=self.namespace, label_selector=self._release_selector
+                            ),
                         )
                         if ingresses.items:
                             ingress = ingresses.items[0]
                             if ingress.spec.rules:
                                 host = ingress.spec.rules[0].host
                                 return f"https://{host}"
-                    except:
-                        pass
+                    except Exception as e:
+                        # No usable ingress - fall back to the service URL below.
+                        # Cancellation (BaseException) still propagates.
+                        self.log.debug(f"Could not look up ingress for hub {self.hub_name}: {e}")
 
                     # Fallback: construct from service
                     # In production, you'd configure ingress properly
@@ -810,12 +885,11 @@ class HubSpawner(LoggingConfigurable):
                     )
 
                 await asyncio.sleep(wait_interval)
-                elapsed += wait_interval
 
             except Exception as e:
-                self.log.debug(f"Waiting for hub... ({elapsed}s/{max_wait}s)")
+                elapsed = time.monotonic() - started
+                self.log.debug(f"Waiting for hub... ({elapsed:.0f}s/{max_wait}s)")
                 await asyncio.sleep(wait_interval)
-                elapsed += wait_interval
 
         # Timeout - return placeholder
         self.log.warning(f"Hub not ready after {max_wait}s, returning placeholder URL")
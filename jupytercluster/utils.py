@@ -1,26 +1,88 @@
 """Utility functions for JupyterCluster"""
 
 import datetime
+import hashlib
+import importlib
 import json
 import logging
+import os
+from functools import lru_cache
 from typing import Any, Dict
 
 import yaml
 
+try:
+    # libyaml-backed loader/dumper are much faster than the pure-Python ones
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is used instead
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Mixed into version-derived ETags so in-memory counters that restart from
+# zero never produce an ETag a client saw from a previous process.
+PROCESS_ID = os.urandom(8).hex()
+
+
+def check_not_modified(handler, *parts: Any) -> bool:
+    """Set an ETag derived from *parts* on *handler* and check it against the request.
+
+    Returns True (with status 304 set) when the client's ``If-None-Match``
+    already matches, so the caller can return before doing any work.
+    """
+    key = ":".join(map(str, (PROCESS_ID,) + parts))
+    handler.set_header("Etag", '"%s"' % hashlib.sha1(key.encode("utf-8")).hexdigest())
+    if handler.check_etag_header():
+        handler.set_status(304)
+        return True
+    return False
+
 
 def _sanitize_for_json(obj: Any) -> Any:
-    """Recursively convert date/datetime objects to ISO format strings for JSON serialization."""
+    """Recursively convert date/datetime objects to ISO format strings for JSON serialization.
+
+    Containers are only copied when something inside them changed, so the
+    common date-free tree is returned as-is without allocating.
+    """
     if isinstance(obj, (datetime.datetime, datetime.date)):
         return obj.isoformat()
     if isinstance(obj, dict):
-        return {k: _sanitize_for_json(v) for k, v in obj.items()}
+        result = None
+        for k, v in obj.items():
+            new = _sanitize_for_json(v)
+            if new is not v:
+                if result is None:
+                    result = dict(obj)
+                result[k] = new
+        return obj if result is None else result
     if isinstance(obj, list):
-        return [_sanitize_for_json(elem) for elem in obj]
+        result = None
+        for i, elem in enumerate(obj):
+            new = _sanitize_for_json(elem)
+            if new is not elem:
+                if result is None:
+                    result = list(obj)
+                result[i] = new
+        return obj if result is None else result
     return obj
 
 
+@lru_cache(maxsize=64)
+def import_class(class_path: str) -> type:
+    """Import and return the class named by a dotted path, e.g. ``pkg.mod.Class``.
+
+    Results are cached, so repeated lookups skip the import machinery.
+    """
+    module_path, class_name = class_path.rsplit(".", 1)
+    return getattr(importlib.import_module(module_path), class_name)
+
+
 def parse_config(config_str: str) -> Dict[str, Any]:
     """
     Parse configuration string as YAML or JSON.
@@ -39,9 +101,20 @@ def parse_config(config_str: str) -> Dict[str, Any]:
 
     config_str = config_str.strip()
 
+    # JSON bodies (what the API usually sends) go straight to the JSON parser; it
+    # never yields dates, so no sanitizing pass is needed. Flow-style YAML such as
+    # ``{a: 1}`` also starts with a brace and falls through to the YAML parser.
+    if config_str[0] in "{[":
+        try:
+            if orjson is not None:
+                return orjson.loads(config_str)
+            return json.loads(config_str)
+        except json.JSONDecodeError:  # orjson's error type subclasses it
+            pass
+
     # Try YAML first (YAML is a superset of JSON, so valid JSON is also valid YAML)
     try:
-        parsed_config = yaml.safe_load(config_str) or {}
+        parsed_config = yaml.load(config_str, Loader=SafeLoader) or {}
         return _sanitize_for_json(parsed_config)
     except yaml.YAMLError as e:
         # If YAML fails, try JSON
@@ -64,7 +137,13 @@ def format_config(config: Dict[str, Any], format: str = "yaml") -> str:
         Formatted configuration string
     """
     if format.lower() == "yaml":
-        return yaml.safe_dump(config, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        return yaml.dump(
+            config,
+            Dumper=SafeDumper,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+        )
     else:
         return json.dumps(config, indent=2, sort_keys=False)
 
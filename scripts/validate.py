@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 """Pre-push validation script to catch errors before committing"""
 
-import ast
+import argparse
 import os
+import re
 import sys
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 # Colors for output
@@ -13,6 +15,9 @@ GREEN = "\033[92m"
 YELLOW = "\033[93m"
 RESET = "\033[0m"
 
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TEMPLATE_DIR = REPO_ROOT / "jupytercluster" / "templates"
+
 
 def print_error(msg):
     print(f"{RED}✗ {msg}{RESET}")
@@ -26,20 +31,34 @@ def print_warning(msg):
     print(f"{YELLOW}⚠ {msg}{RESET}")
 
 
+# Caches, build output and virtualenvs: not our code, and possibly huge
+SKIP_DIRS = frozenset(
+    {"__pycache__", ".git", ".cache", "build", "dist", "node_modules", ".venv", "venv", ".tox"}
+)
+
+
+def iter_python_files(root):
+    """Yield every .py file under root, never descending into SKIP_DIRS or *.egg-info"""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [
+            d for d in dirnames if d not in SKIP_DIRS and not d.endswith(".egg-info")
+        ]
+        for filename in filenames:
+            if filename.endswith(".py"):
+                yield Path(dirpath) / filename
+
+
 def check_python_syntax():
     """Check all Python files have valid syntax"""
-    print("\n[1/6] Checking Python syntax...")
+    print("Checking Python syntax...")
     errors = []
-    repo_root = Path(__file__).parent.parent
-
-    for py_file in repo_root.rglob("*.py"):
-        # Skip __pycache__ and .git
-        if "__pycache__" in str(py_file) or ".git" in str(py_file):
-            continue
 
+    for py_file in iter_python_files(REPO_ROOT):
         try:
-            with open(py_file, "r") as f:
-                ast.parse(f.read(), py_file.name)
+            # compile() on the raw bytes checks syntax without decoding to str or
+            # building the Python-level AST objects that ast.parse() returns
+            with open(py_file, "rb") as f:
+                compile(f.read(), str(py_file), "exec", dont_inherit=True)
         except SyntaxError as e:
             errors.append(f"{py_file}:{e.lineno}: {e.msg}")
         except Exception as e:
@@ -54,64 +73,93 @@ def check_python_syntax():
     return True
 
 
-def check_black_formatting():
-    """Check code formatting with black"""
-    print("\n[2/6] Checking code formatting (black)...")
-    repo_root = Path(__file__).parent.parent
+# Paths are appended by start_tool. isort's --quiet keeps only its per-file
+# errors; black's would also hide the "would reformat" lines, so it is not used
+BLACK_CMD = ["python3", "-m", "black", "--check"]
+ISORT_CMD = ["python3", "-m", "isort", "--check-only", "--quiet"]
+LINT_PATHS = ["jupytercluster/", "tests/"]
 
+
+def changed_python_files():
+    """Python files under LINT_PATHS added or modified relative to HEAD (staged or not)"""
     result = subprocess.run(
-        ["python3", "-m", "black", "--check", "jupytercluster/", "tests/"],
-        cwd=repo_root,
+        ["git", "diff", "--name-only", "--diff-filter=ACMR", "HEAD", "--"]
+        + [f"{path}*.py" for path in LINT_PATHS],
+        cwd=REPO_ROOT,
         capture_output=True,
         text=True,
     )
-
     if result.returncode != 0:
+        return []
+    return result.stdout.split()
+
+
+def start_tool(cmd, paths=None):
+    """Start an external checker in the background, capturing its output"""
+    return subprocess.Popen(
+        cmd + (paths or LINT_PATHS),
+        cwd=REPO_ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+
+def check_black_formatting(process=None):
+    """Check code formatting with black"""
+    print("Checking code formatting (black)...")
+    if process is None:
+        process = start_tool(BLACK_CMD)
+    stdout, stderr = process.communicate()
+
+    if process.returncode != 0:
         print_error("Code formatting issues found")
-        print(result.stdout)
-        print(result.stderr)
+        print(stdout)
+        print(stderr)
         return False
 
     print_success("Code formatting is correct")
     return True
 
 
-def check_isort():
+def check_isort(process=None):
     """Check import sorting"""
-    print("\n[3/6] Checking import sorting (isort)...")
-    repo_root = Path(__file__).parent.parent
+    print("Checking import sorting (isort)...")
+    if process is None:
+        process = start_tool(ISORT_CMD)
+    stdout, stderr = process.communicate()
 
-    result = subprocess.run(
-        ["python3", "-m", "isort", "--check-only", "jupytercluster/", "tests/"],
-        cwd=repo_root,
-        capture_output=True,
-        text=True,
-    )
-
-    if result.returncode != 0:
+    if process.returncode != 0:
         print_error("Import sorting issues found")
-        print(result.stdout)
-        print(result.stderr)
+        print(stdout)
+        print(stderr)
         return False
 
     print_success("Import sorting is correct")
     return True
 
 
+@lru_cache(maxsize=None)
+def get_template_loader(template_dir):
+    """Shared tornado Loader, so templates compiled by the parse check are reused when rendering"""
+    from tornado.template import Loader
+
+    return Loader(str(template_dir))
+
+
 def check_templates_parse():
     """Check all templates can be parsed"""
-    print("\n[4/6] Checking template syntax...")
-    repo_root = Path(__file__).parent.parent
-    template_dir = repo_root / "jupytercluster" / "templates"
+    print("Checking template syntax...")
+    template_dir = TEMPLATE_DIR
 
     if not template_dir.exists():
         print_warning("Template directory not found")
         return True
 
     try:
-        from tornado.template import Loader, ParseError
+        from tornado.template import ParseError
 
-        loader = Loader(str(template_dir))
+        loader = get_template_loader(template_dir)
         errors = []
 
         for template_file in template_dir.glob("*.html"):
@@ -138,17 +186,14 @@ def check_templates_parse():
 
 def check_templates_render():
     """Check templates can render with required variables"""
-    print("\n[5/6] Checking template rendering...")
-    repo_root = Path(__file__).parent.parent
-    template_dir = repo_root / "jupytercluster" / "templates"
+    print("Checking template rendering...")
+    template_dir = TEMPLATE_DIR
 
     if not template_dir.exists():
         return True
 
     try:
-        from tornado.template import Loader
-
-        loader = Loader(str(template_dir))
+        loader = get_template_loader(template_dir)
 
         def static_url(path):
             return f"/static/{path}"
@@ -246,35 +291,37 @@ def check_templates_render():
         return True
 
 
+# Template constructs that tornado does not support, in reporting order
+COMMON_ISSUES = {
+    "jinja": "Contains Jinja2 syntax (should use {% end %})",
+    "length": "Uses |length filter (should use len())",
+    "loop_last": "Uses loop.last (not supported in Tornado)",
+    "module_template": "Contains invalid {% module Template() %} call",
+}
+COMMON_ISSUES_RE = re.compile(
+    r"(?P<jinja>\{% end(?:block|if|for))"
+    r"|(?P<length>\|length)"
+    r"|(?P<loop_last>loop\.last)"
+    r"|(?P<module_template>\{% module Template)"
+)
+
+
 def check_common_issues():
     """Check for common issues"""
-    print("\n[6/6] Checking for common issues...")
-    repo_root = Path(__file__).parent.parent
+    print("Checking for common issues...")
     errors = []
 
     # Check for Jinja2 syntax in templates
-    template_dir = repo_root / "jupytercluster" / "templates"
+    template_dir = TEMPLATE_DIR
     if template_dir.exists():
         for template_file in template_dir.glob("*.html"):
             with open(template_file, "r") as f:
                 content = f.read()
-                # Check for Jinja2-only syntax
-                if "{% endblock" in content or "{% endif" in content or "{% endfor" in content:
-                    errors.append(
-                        f"{template_file.name}: Contains Jinja2 syntax (should use {{% end %}})"
-                    )
-                if "|length" in content:
-                    errors.append(
-                        f"{template_file.name}: Uses |length filter (should use len())"
-                    )
-                if "loop.last" in content:
-                    errors.append(
-                        f"{template_file.name}: Uses loop.last (not supported in Tornado)"
-                    )
-                if "{% module Template" in content:
-                    errors.append(
-                        f"{template_file.name}: Contains invalid {{% module Template() %}} call"
-                    )
+            # One scan per file finds every kind of issue; report each kind once
+            found = {m.lastgroup for m in COMMON_ISSUES_RE.finditer(content)}
+            for issue, message in COMMON_ISSUES.items():
+                if issue in found:
+                    errors.append(f"{template_file.name}: {message}")
 
     if errors:
         for error in errors:
@@ -285,25 +332,69 @@ def check_common_issues():
     return True
 
 
-def main():
-    """Run all validation checks"""
+# Check groups selectable with --only, in the order they run: cheapest first,
+# so that --fail-fast stops before the slower checks whenever it can
+CHECKS = {
+    "syntax": [check_python_syntax],
+    "common": [check_common_issues],
+    "isort": [check_isort],
+    "black": [check_black_formatting],
+    "templates": [check_templates_parse, check_templates_render],
+}
+
+
+def main(argv=None):
+    """Run all validation checks (or only the groups named with --only)"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=list(CHECKS),
+        help="Run only these checks; tools and imports for the others are skipped",
+    )
+    parser.add_argument(
+        "--changed",
+        action="store_true",
+        help="Run black and isort only on files changed since HEAD (all files if none)",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first failing check",
+    )
+    args = parser.parse_args(argv)
+
     print("=" * 60)
     print("Pre-push Validation")
     print("=" * 60)
 
-    checks = [
-        check_python_syntax,
-        check_black_formatting,
-        check_isort,
-        check_templates_parse,
-        check_templates_render,
-        check_common_issues,
-    ]
+    selected = args.only or list(CHECKS)
+    checks = [check for name in CHECKS if name in selected for check in CHECKS[name]]
+
+    # black and isort each run in their own interpreter; start both up front so
+    # they work in parallel with each other and with the in-process checks,
+    # while results are still reported in order
+    tools = {}
+    needs_tools = check_black_formatting in checks or check_isort in checks
+    paths = changed_python_files() if args.changed and needs_tools else None
+    if check_black_formatting in checks:
+        tools[check_black_formatting] = start_tool(BLACK_CMD, paths)
+    if check_isort in checks:
+        tools[check_isort] = start_tool(ISORT_CMD, paths)
 
     all_passed = True
-    for check in checks:
-        if not check():
+    for number, check in enumerate(checks, 1):
+        print(f"\n[{number}/{len(checks)}] ", end="")
+        passed = check(tools.pop(check)) if check in tools else check()
+        if not passed:
             all_passed = False
+            if args.fail_fast:
+                break
+
+    # Tools whose results were never collected because of --fail-fast
+    for process in tools.values():
+        process.kill()
+        process.wait()
 
     print("\n" + "=" * 60)
     if all_passed:
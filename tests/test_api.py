@@ -1,6 +1,7 @@
 """Tests for API handlers"""
 
 import json
+from datetime import datetime
 from unittest.mock import Mock, patch
 
 import pytest
@@ -9,6 +10,8 @@ from tornado.web import Application
 
 from jupytercluster.api.hubs import HubAPIHandler, HubListAPIHandler
 from jupytercluster.app import HealthHandler, JupyterCluster
+from jupytercluster.hub import HubInstance
+from jupytercluster.orm import Hub as ORMHub
 
 
 class TestAPIHandlers(AsyncHTTPTestCase):
@@ -28,6 +31,7 @@ class TestAPIHandlers(AsyncHTTPTestCase):
         # Mock jupytercluster settings
         mock_app = Mock()
         mock_app.hubs = {}
+        mock_app.iter_hubs_owned_by.side_effect = lambda owner: iter(())
         app.settings["jupytercluster"] = mock_app
 
         return app
@@ -71,3 +75,65 @@ class TestAPIHandlers(AsyncHTTPTestCase):
 
         response = self.fetch("/api/hubs", headers={"X-User": "test-user"})
         assert response.code == 200
+
+    @patch("jupytercluster.api.base.APIHandler.get_current_user")
+    def test_list_hubs_reflects_changes(self, mock_user):
+        """Hub list is valid JSON and picks up changes to a hub"""
+        mock_user.return_value = "test-user"
+        hub = HubInstance(
+            ORMHub(
+                name="h1",
+                namespace="jc-h1",
+                owner="test-user",
+                helm_release_name="jc-h1",
+                helm_chart="jupyterhub/jupyterhub",
+                status="stopped",
+                created=datetime(2024, 1, 1),
+                last_activity=datetime(2024, 1, 1),
+            )
+        )
+        mock_app = self._app.settings["jupytercluster"]
+        mock_app.hubs = {"h1": hub}
+        mock_app.iter_hubs_owned_by.side_effect = lambda owner: iter([hub])
+
+        data = json.loads(self.fetch("/api/hubs").body)
+        assert data["hubs"][0]["status"] == "stopped"
+        assert data["hubs"][0]["created"] == "2024-01-01T00:00:00"
+        assert data["_pagination"]["total"] == 1
+
+        hub.status = "running"
+        data = json.loads(self.fetch("/api/hubs").body)
+        assert data["hubs"][0]["status"] == "running"
+
+    @patch("jupytercluster.api.base.APIHandler.get_current_user")
+    def test_list_hubs_etag(self, mock_user):
+        """Unchanged hub list returns 304 for a matching If-None-Match"""
+        mock_user.return_value = "test-user"
+
+        response = self.fetch("/api/hubs")
+        etag = response.headers["Etag"]
+        response = self.fetch("/api/hubs", headers={"If-None-Match": etag})
+        assert response.code == 304
+
+        mock_user.return_value = "other-user"
+        response = self.fetch("/api/hubs", headers={"If-None-Match": etag})
+        assert response.code == 200
+
+
+@pytest.mark.parametrize(
+    "name,valid",
+    [
+        ("team-a", True),
+        ("a", True),
+        ("a" * 63, True),
+        ("a" * 64, False),
+        ("Team-A", False),
+        ("-team", False),
+        ("team-", False),
+        ("team_a", False),
+        ("", False),
+    ],
+)
+def test_is_valid_namespace_name(name, valid):
+    """Namespace names must be RFC 1123 DNS labels"""
+    assert JupyterCluster._is_valid_namespace_name(name) is valid
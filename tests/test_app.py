@@ -0,0 +1,41 @@
+"""Tests for the JupyterCluster application"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from jupytercluster.app import HealthHandler, JupyterCluster
+from jupytercluster.auth import SimpleAuthenticator
+
+
+@pytest.fixture
+def app():
+    """A JupyterCluster on an in-memory database, with Kubernetes and Helm patched out"""
+    with patch("jupytercluster.dbutil.upgrade"), patch(
+        "jupytercluster.spawner.config.load_incluster_config"
+    ), patch("jupytercluster.spawner.HubSpawner._delete_helm_release", AsyncMock()):
+        yield JupyterCluster(db_url="sqlite:///:memory:")
+
+
+async def test_hubs_version_changes_on_delete_then_create(app):
+    """Replacing one hub with another keeps the count but must change the version"""
+    await app.create_hub("a", "test-user")
+    before = app.hubs_version
+
+    await app.delete_hub("a")
+    await app.create_hub("b", "test-user")
+
+    assert len(app.hubs) == 1
+    assert app.hubs_version != before
+
+
+def test_authenticator_handlers_are_registered():
+    """Routes from Authenticator.get_handlers are served, ahead of the catch-all"""
+    extra = [(r"/auth/extra", HealthHandler)]
+    with patch("jupytercluster.dbutil.upgrade"), patch.object(
+        SimpleAuthenticator, "get_handlers", return_value=extra
+    ):
+        app = JupyterCluster(db_url="sqlite:///:memory:")
+
+    patterns = [rule.matcher.regex.pattern for rule in app.web_app.wildcard_router.rules]
+    assert patterns.index(r"/auth/extra$") < patterns.index(r".*$")
@@ -0,0 +1,91 @@
+"""Tests for HubInstance"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from jupytercluster.hub import HubInstance
+from jupytercluster.orm import Base
+from jupytercluster.orm import Hub as ORMHub
+
+
+class TestHubInstance:
+    """Test HubInstance"""
+
+    @pytest.fixture
+    def hub(self):
+        """Create a HubInstance backed by an unsaved ORM row"""
+        return HubInstance(
+            ORMHub(
+                name="test-hub",
+                namespace="jupyterhub-test-hub",
+                owner="test-user",
+                helm_release_name="jupyterhub-test-hub",
+                helm_chart="jupyterhub/jupyterhub",
+                status="running",
+                values={"hub": {"config": {}}},
+                created=datetime(2024, 1, 1),
+                last_activity=datetime(2024, 1, 2),
+            )
+        )
+
+    def test_status_is_str(self, hub):
+        """status reads a String column, so to_dict() needs no str() cast"""
+        assert isinstance(hub.status, str)
+        assert isinstance(hub.to_dict()["status"], str)
+
+    def test_attributes_write_through(self, hub):
+        """Assignments land on the ORM row and invalidate cached output"""
+        before = hub.to_dict()
+        version = hub.version
+
+        hub.status = "stopped"
+
+        assert hub.orm_hub.status == "stopped"
+        assert hub.version != version
+        assert before["status"] == "running"
+        assert hub.to_dict()["status"] == "stopped"
+
+    def test_new_instance_has_new_version(self, hub):
+        """Wrapping the same row again never repeats an earlier instance's version"""
+        assert HubInstance(hub.orm_hub).version != hub.version
+
+    def test_null_values_are_not_shared(self):
+        """Hubs with NULL values each get their own empty dict"""
+        first = HubInstance(ORMHub(name="a", namespace="a", owner="u", helm_release_name="a"))
+        second = HubInstance(ORMHub(name="b", namespace="b", owner="u", helm_release_name="b"))
+
+        first.values["ingress"] = {"enabled": True}
+
+        assert first.values == {"ingress": {"enabled": True}}
+        assert first.orm_hub.values == {"ingress": {"enabled": True}}
+        assert second.values == {}
+
+    def test_values_edited_in_place_and_reassigned(self, hub):
+        """Assigning back an in-place edited values dict is saved and drops caches"""
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(hub.orm_hub)
+            session.commit()
+            assert "extra" not in hub.values_yaml
+
+            values = hub.values
+            values["extra"] = 2
+            hub.values = values
+
+            assert hub.orm_hub in session.dirty
+            assert "extra: 2" in hub.values_yaml
+            assert hub.to_dict()["values"]["extra"] == 2
+            session.commit()
+            session.expire(hub.orm_hub)
+            assert hub.orm_hub.values["extra"] == 2
+
+    def test_values_yaml_tracks_values(self, hub):
+        """values_yaml is cached until values is reassigned"""
+        assert "config" in hub.values_yaml
+        hub.values = {"proxy": {}}
+        assert hub.orm_hub.values == {"proxy": {}}
+        assert hub.values_yaml.startswith("proxy")
@@ -1,24 +1,26 @@
 """Tests for HubSpawner"""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from jupytercluster.spawner import HubSpawner
+from jupytercluster.spawner import HubSpawner, set_helm_concurrency
+
+
+@pytest.fixture(scope="module")
+def spawner():
+    """Create a HubSpawner instance, shared by the tests (they patch, not mutate, it)"""
+    with patch("jupytercluster.spawner.config.load_incluster_config"):
+        spawner = HubSpawner(
+            hub_name="test-hub", namespace="jupyterhub-test-hub", owner="test-user"
+        )
+        return spawner
 
 
 class TestHubSpawner:
     """Test HubSpawner"""
 
-    @pytest.fixture
-    def spawner(self):
-        """Create a HubSpawner instance"""
-        with patch("jupytercluster.spawner.config.load_incluster_config"):
-            spawner = HubSpawner(
-                hub_name="test-hub", namespace="jupyterhub-test-hub", owner="test-user"
-            )
-            return spawner
-
     def test_validate_helm_values_whitelist(self, spawner):
         """Test Helm values whitelist validation"""
         values = {
@@ -77,3 +79,52 @@ class TestHubSpawner:
 
             result = await spawner.poll()
             assert result == 1  # Stopped
+
+    @pytest.mark.asyncio
+    async def test_storage_class_list_is_cached(self, spawner):
+        """Test repeated storage class checks share one LIST"""
+        from jupytercluster import spawner as spawner_module
+
+        spawner_module._cluster_lists.clear()
+        sc = Mock()
+        sc.metadata.name = "fast"
+        with patch.object(spawner.storage_v1, "list_storage_class") as mock_list:
+            mock_list.return_value.items = [sc]
+
+            assert await spawner._check_storage_class_exists("fast")
+            assert not await spawner._check_storage_class_exists("slow")
+            assert mock_list.call_count == 1
+        spawner_module._cluster_lists.clear()
+
+    @pytest.mark.asyncio
+    async def test_helm_concurrency_limit(self, spawner):
+        """set_helm_concurrency bounds helm processes, even after a semaphore exists"""
+        running = peak = 0
+
+        async def fake_helm(cmd, input=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return 0, ""
+
+        with patch.object(spawner, "_run_helm_process", fake_helm):
+            await spawner._run_helm(["helm", "version"])
+            set_helm_concurrency(1)
+            try:
+                await asyncio.gather(*(spawner._run_helm(["helm", "version"]) for _ in range(3)))
+            finally:
+                set_helm_concurrency(8)
+        assert peak == 1
+
+    def test_helm_repo_lock_per_event_loop(self, spawner):
+        """_ensure_helm_repo works from a second event loop after the first is gone"""
+        with patch.object(spawner, "_run_helm", AsyncMock(return_value=(1, ""))) as mock_helm:
+            for _ in range(2):
+                loop = asyncio.new_event_loop()
+                try:
+                    loop.run_until_complete(spawner._ensure_helm_repo())
+                finally:
+                    loop.close()
+        assert mock_helm.call_count == 4
@@ -10,19 +10,21 @@ except ImportError:
     pytest.skip("tornado not available", allow_module_level=True)
 
 
-class TestTemplates:
-    """Test that all templates can be parsed and rendered"""
+@pytest.fixture(scope="module")
+def template_dir():
+    """Get template directory path"""
+    here = os.path.dirname(os.path.dirname(__file__))
+    return os.path.join(here, "jupytercluster", "templates")
+
 
-    @pytest.fixture
-    def template_dir(self):
-        """Get template directory path"""
-        here = os.path.dirname(os.path.dirname(__file__))
-        return os.path.join(here, "jupytercluster", "templates")
+@pytest.fixture(scope="module")
+def loader(template_dir):
+    """Create template loader, shared so each template is compiled once per module"""
+    return Loader(template_dir)
 
-    @pytest.fixture
-    def loader(self, template_dir):
-        """Create template loader"""
-        return Loader(template_dir)
+
+class TestTemplates:
+    """Test that all templates can be parsed and rendered"""
 
     def test_all_templates_parse(self, template_dir, loader):
         """Test that all HTML templates can be parsed without errors"""